@@ -4,144 +4,207 @@ Flask Backend for HFCL Cable Data Processing
 Integrates with the existing combined_scraper.py functionality
 """
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.parser import ParseFailedException
+from streaming_form_data.targets import FileTarget
 import os
 import sys
 import tempfile
 import shutil
 from pathlib import Path
-import traceback
-import json
+import orjson
 import platform
+import logging
 import time
 import uuid
+import itertools
+import secrets
 
 # Add the scraper directory to Python path
 current_dir = Path(__file__).parent
 scraper_dir = current_dir.parent / "scraper"
 sys.path.insert(0, str(scraper_dir))
 
+# Logging - under Gunicorn, reuse its error log handlers so messages land in the same stream
+logger = logging.getLogger(__name__)
+if 'gunicorn' in os.environ.get('SERVER_SOFTWARE', ''):
+    gunicorn_logger = logging.getLogger('gunicorn.error')
+    logger.handlers = gunicorn_logger.handlers
+    logger.setLevel(gunicorn_logger.level)
+    logger.propagate = False
+    # The scraper keeps its own LOG_LEVEL but writes through the same handlers
+    scraper_logger = logging.getLogger('combined_scraper')
+    scraper_logger.handlers = gunicorn_logger.handlers
+    scraper_logger.propagate = False
+else:
+    logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO'), format='%(message)s')
+
 # Import the scraper functionality
-from combined_scraper import process_uploaded_pdf, run_all_functionalities
+from combined_scraper import process_uploaded_pdf, run_all_functionalities, _json_outputs_for
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify() and request.get_json()"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Same argument handling as jsonify(): one value as-is, several as a list, keywords
+        # as a dict. Done here rather than via Flask's private helper so upgrades cannot break it
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        if len(args) == 1:
+            obj = args[0]
+        else:
+            obj = args or kwargs or None
+        # Skip the str round trip - orjson already produces the response bytes
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for Angular frontend
 
 # Configuration
-UPLOAD_FOLDER = current_dir / "uploads"
 PROCESSED_FOLDER = current_dir / "processed"
 OUTPUT_FOLDER = current_dir / "output"
+SCRAPER_DATA_FOLDER = scraper_dir / "data"
 
 # Create necessary directories
-UPLOAD_FOLDER.mkdir(exist_ok=True)
 PROCESSED_FOLDER.mkdir(exist_ok=True)
 OUTPUT_FOLDER.mkdir(exist_ok=True)
+SCRAPER_DATA_FOLDER.mkdir(exist_ok=True)
 
-# Allowed file extensions
-ALLOWED_EXTENSIONS = {'pdf'}
+# Size of each read from the request stream while parsing uploads
+UPLOAD_CHUNK_SIZE = 64 * 1024
 
-def allowed_file(filename):
-    """Check if file extension is allowed"""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+# Process-local suffix counter, seeded from the start time so names stay unique across restarts
+_FILENAME_COUNTER = itertools.count(int(time.time()))
 
-def get_unique_filename(original_filename, target_dir):
+def get_unique_filename(base_name, extension, target_dir):
     """Generate a unique filename to avoid conflicts"""
-    base_name = Path(original_filename).stem
-    extension = Path(original_filename).suffix
-    
     # Try the original name first
+    original_filename = f"{base_name}{extension}"
     target_path = target_dir / original_filename
     
     if not target_path.exists():
         return original_filename
     
-    # If file exists, add timestamp and random suffix
-    timestamp = int(time.time())
-    random_suffix = str(uuid.uuid4())[:8]
-    unique_filename = f"{base_name}_{timestamp}_{random_suffix}{extension}"
+    # If file exists, add counter and random suffix
+    unique_filename = f"{base_name}_{next(_FILENAME_COUNTER):x}_{secrets.token_hex(4)}{extension}"
     
     return unique_filename
 
-def safe_copy_file(source_path, target_path):
-    """Safely copy a file with error handling"""
-    try:
-        # Ensure target directory exists
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # If target file exists, remove it first
-        if target_path.exists():
-            try:
-                target_path.unlink()
-            except PermissionError:
-                # If we can't remove, use a unique name
-                unique_name = get_unique_filename(target_path.name, target_path.parent)
-                target_path = target_path.parent / unique_name
-        
-        # Copy the file
-        shutil.copy2(str(source_path), str(target_path))
-        return target_path, None
-        
-    except PermissionError as e:
-        return None, f"Permission denied: {str(e)}"
-    except Exception as e:
-        return None, f"File copy error: {str(e)}"
+def format_cable_data(cable_data, original_filename, result):
+    """Format one scraper JSON record for frontend display"""
+    return {
+        'metadata': {
+            'fiber_type': cable_data.get('fiberType', 'Unknown'),
+            'source_file': original_filename,  # Use original filename for display
+            'cable_description': cable_data.get('cableDescription', 'Unknown')
+        },
+        'technical_specifications': {
+            'Cable Properties': {
+                'Fiber Count': cable_data.get('fiberCount', 'N/A'),
+                'Cable Type': cable_data.get('typeofCable', 'N/A'),
+                'Tube Type': cable_data.get('tube', 'N/A'),
+                'Fiber Type': cable_data.get('fiberType', 'N/A'),
+                'Diameter': cable_data.get('diameter', 'N/A'),
+                'Tensile Strength': cable_data.get('tensile', 'N/A'),
+                'Crush Resistance': cable_data.get('crush', 'N/A'),
+                'NESC Condition': cable_data.get('nescCondition', 'N/A'),
+                'Blowing Length': cable_data.get('blowingLength', 'N/A')
+            },
+            'API Status': {
+                'Records Posted': result.get('api_total_count', 0),
+                'Successful': result.get('api_success_count', 0),
+                'Failed': result.get('api_failure_count', 0),
+                'Processing Time': f"{result.get('processing_time_seconds', 0)}s"
+            }
+        },
+        'document_content': {
+            'Processing Summary': f"Successfully processed {original_filename} in {result.get('processing_time_seconds', 0)} seconds"
+        }
+    }
 
 @app.route('/api/upload', methods=['POST'])
 def upload_file():
     """Handle PDF file upload and processing"""
     try:
-        # Check if file was uploaded
-        if 'file' not in request.files:
+        # Check if a multipart body was sent at all
+        if request.mimetype != 'multipart/form-data':
             return jsonify({'error': 'No file part'}), 400
         
-        file = request.files['file']
-        
-        # Check if file was selected
-        if file.filename == '':
-            return jsonify({'error': 'No file selected'}), 400
-        
-        # Check if file type is allowed
-        if not allowed_file(file.filename):
-            return jsonify({'error': 'Only PDF files are allowed'}), 400
-        
-        # Generate unique filename for upload
-        unique_filename = get_unique_filename(file.filename, UPLOAD_FOLDER)
-        temp_path = UPLOAD_FOLDER / unique_filename
-        
+        # Stream the multipart body straight into the scraper data directory
+        # instead of letting Werkzeug buffer it; it is renamed once validated
+        temp_path = SCRAPER_DATA_FOLDER / f"{uuid.uuid4().hex}.part"
         try:
-            # Save uploaded file temporarily
-            file.save(str(temp_path))
-            print(f"📁 File saved temporarily: {temp_path}")
-        except Exception as e:
-            return jsonify({
-                'success': False,
-                'error': f'Failed to save uploaded file: {str(e)}'
-            }), 500
-        
-        # Copy file to scraper data directory for processing
-        scraper_data_dir = scraper_dir / "data"
-        scraper_data_dir.mkdir(exist_ok=True)
-        
-        # Generate unique filename for scraper directory
-        scraper_filename = get_unique_filename(file.filename, scraper_data_dir)
-        target_path = scraper_data_dir / scraper_filename
-        
-        # Safely copy the file
-        copied_path, copy_error = safe_copy_file(temp_path, target_path)
-        if copy_error:
-            # Clean up temp file
-            if temp_path.exists():
-                temp_path.unlink()
-            return jsonify({
-                'success': False,
-                'error': f'Failed to copy file to scraper directory: {copy_error}'
-            }), 500
+            target = FileTarget(str(temp_path))
+            
+            try:
+                parser = StreamingFormDataParser(headers=request.headers)
+                parser.register('file', target)
+                while True:
+                    chunk = request.stream.read(UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    parser.data_received(chunk)
+            except ParseFailedException as e:
+                # Malformed multipart body - a client error, not a failure to save
+                return jsonify({
+                    'success': False,
+                    'error': f'Malformed multipart upload: {str(e)}'
+                }), 400
+            except Exception as e:
+                return jsonify({
+                    'success': False,
+                    'error': f'Failed to save uploaded file: {str(e)}'
+                }), 500
+            
+            original_filename = target.multipart_filename
+            
+            # Check if file was uploaded
+            if original_filename is None:
+                return jsonify({'error': 'No file part'}), 400
+            
+            # Check if file was selected and file type is allowed - the name is split once
+            # here and the parts reused for every filename derived from it below
+            base_name, extension = os.path.splitext(original_filename)
+            validation_error = None
+            if original_filename == '':
+                validation_error = 'No file selected'
+            elif extension.lower() != '.pdf':
+                validation_error = 'Only PDF files are allowed'
+            
+            if validation_error:
+                return jsonify({'error': validation_error}), 400
+            
+            # Generate unique filename for scraper directory
+            scraper_filename = get_unique_filename(base_name, extension, SCRAPER_DATA_FOLDER)
+            target_path = SCRAPER_DATA_FOLDER / scraper_filename
+            
+            try:
+                # Rename in place - a metadata-only operation, no bytes are copied
+                os.replace(temp_path, target_path)
+            except Exception as e:
+                return jsonify({
+                    'success': False,
+                    'error': f'Failed to save file to scraper directory: {str(e)}'
+                }), 500
+        finally:
+            # Whatever returned early above, the partial upload is not left in the watched
+            # directory; after a successful rename there is nothing left to remove
+            temp_path.unlink(missing_ok=True)
         
-        print(f"📁 File copied to scraper data directory: {copied_path}")
+        logger.info("📁 File saved to scraper data directory: %s", target_path)
         
         # Process the PDF using the existing scraper functionality
-        print(f"🚀 Starting PDF processing for: {scraper_filename}")
+        logger.info("🚀 Starting PDF processing for: %s", scraper_filename)
         
         try:
             # Use the process_uploaded_pdf function from combined_scraper.py
@@ -149,96 +212,70 @@ def upload_file():
             
             if result['success']:
                 # Get the generated JSON files
-                scraper_output_dir = scraper_dir / "output"
-                pdf_stem = Path(scraper_filename).stem
-                json_files = list(scraper_output_dir.glob(f"{pdf_stem}_*.json"))
+                json_files = _json_outputs_for(scraper_dir / "output", scraper_filename)
                 
-                # Load the JSON data for frontend display
-                extracted_data = []
-                for json_file in json_files:
-                    try:
-                        with open(json_file, 'r', encoding='utf-8') as f:
-                            cable_data = json.load(f)
-                            # Format data for frontend display
-                            formatted_data = {
-                                'metadata': {
-                                    'fiber_type': cable_data.get('fiberType', 'Unknown'),
-                                    'source_file': file.filename,  # Use original filename for display
-                                    'cable_description': cable_data.get('cableDescription', 'Unknown')
-                                },
-                                'technical_specifications': {
-                                    'Cable Properties': {
-                                        'Fiber Count': cable_data.get('fiberCount', 'N/A'),
-                                        'Cable Type': cable_data.get('typeofCable', 'N/A'),
-                                        'Tube Type': cable_data.get('tube', 'N/A'),
-                                        'Fiber Type': cable_data.get('fiberType', 'N/A'),
-                                        'Diameter': cable_data.get('diameter', 'N/A'),
-                                        'Tensile Strength': cable_data.get('tensile', 'N/A'),
-                                        'Crush Resistance': cable_data.get('crush', 'N/A'),
-                                        'NESC Condition': cable_data.get('nescCondition', 'N/A'),
-                                        'Blowing Length': cable_data.get('blowingLength', 'N/A')
-                                    },
-                                    'API Status': {
-                                        'Records Posted': result.get('api_total_count', 0),
-                                        'Successful': result.get('api_success_count', 0),
-                                        'Failed': result.get('api_failure_count', 0),
-                                        'Processing Time': f"{result.get('processing_time_seconds', 0)}s"
-                                    }
-                                },
-                                'document_content': {
-                                    'Processing Summary': f"Successfully processed {file.filename} in {result.get('processing_time_seconds', 0)} seconds"
-                                }
-                            }
-                            extracted_data.append(formatted_data)
-                    except Exception as e:
-                        print(f"❌ Error loading JSON file {json_file}: {e}")
-                
-                # Move processed file to processed folder (use original filename)
-                processed_filename = get_unique_filename(file.filename, PROCESSED_FOLDER)
+                # Move processed file to processed folder (use original filename) before
+                # the response starts streaming
+                processed_filename = get_unique_filename(base_name, extension, PROCESSED_FOLDER)
                 processed_path = PROCESSED_FOLDER / processed_filename
                 
                 try:
-                    shutil.move(str(copied_path), str(processed_path))
-                    print(f"📁 Moved processed file to: {processed_path}")
-                except Exception as e:
-                    print(f"⚠️  Warning: Could not move processed file: {e}")
-                    # Try to copy instead
+                    os.replace(target_path, processed_path)
+                    logger.info("📁 Moved processed file to: %s", processed_path)
+                except OSError:
+                    # Different filesystem - fall back to a copying move
                     try:
-                        shutil.copy2(str(copied_path), str(processed_path))
-                        copied_path.unlink()  # Remove from scraper directory
-                    except Exception as copy_e:
-                        print(f"⚠️  Warning: Could not copy processed file: {copy_e}")
+                        shutil.move(target_path, processed_path)
+                        logger.info("📁 Moved processed file to: %s", processed_path)
+                    except Exception as move_e:
+                        logger.warning("⚠️  Warning: Could not move processed file: %s", move_e)
                 
-                # Clean up temp file
-                if temp_path.exists():
-                    temp_path.unlink()
+                processing_summary = {
+                    'pdf_processed': result.get('pdf_processed', False),
+                    'api_posted': result.get('api_posted', False),
+                    'cables_extracted': result.get('cables_extracted', 0),
+                    'api_success_count': result.get('api_success_count', 0),
+                    'api_failure_count': result.get('api_failure_count', 0),
+                    'processing_time_seconds': result.get('processing_time_seconds', 0)
+                }
                 
-                print(f"✅ Processing complete. Generated {len(extracted_data)} cable variants")
+                def generate():
+                    # Load, format and send one JSON file at a time so only the current
+                    # record is held in memory
+                    yield b'{"success":true,"results":['
+                    variant_count = 0
+                    for json_file in json_files:
+                        try:
+                            formatted_data = format_cable_data(
+                                orjson.loads(json_file.read_bytes()), original_filename, result
+                            )
+                        except Exception as e:
+                            logger.error("❌ Error loading JSON file %s: %s", json_file, e)
+                            continue
+                        if variant_count:
+                            yield b','
+                        yield orjson.dumps(formatted_data)
+                        variant_count += 1
+                    
+                    logger.info("✅ Processing complete. Generated %d cable variants", variant_count)
+                    
+                    # The count is only known now, so the message goes after the results;
+                    # [1:] drops the opening brace to continue the outer object
+                    yield b'],' + orjson.dumps({
+                        'message': f'File processed successfully. Generated {variant_count} cable variants.',
+                        'processing_summary': processing_summary
+                    })[1:]
                 
-                return jsonify({
-                    'success': True,
-                    'message': f'File processed successfully. Generated {len(extracted_data)} cable variants.',
-                    'results': extracted_data,
-                    'processing_summary': {
-                        'pdf_processed': result.get('pdf_processed', False),
-                        'api_posted': result.get('api_posted', False),
-                        'cables_extracted': result.get('cables_extracted', 0),
-                        'api_success_count': result.get('api_success_count', 0),
-                        'api_failure_count': result.get('api_failure_count', 0),
-                        'processing_time_seconds': result.get('processing_time_seconds', 0)
-                    }
-                })
+                return Response(stream_with_context(generate()), mimetype='application/json')
             else:
                 # Processing failed
                 error_msg = result.get('error', 'Unknown processing error')
-                print(f"❌ Processing failed: {error_msg}")
+                logger.error("❌ Processing failed: %s", error_msg)
                 
                 # Clean up files
-                if temp_path.exists():
-                    temp_path.unlink()
-                if copied_path and copied_path.exists():
+                if target_path.exists():
                     try:
-                        copied_path.unlink()
+                        target_path.unlink()
                     except:
                         pass
                 
@@ -249,15 +286,12 @@ def upload_file():
                 
         except Exception as e:
             error_msg = f"Error during PDF processing: {str(e)}"
-            print(f"❌ {error_msg}")
-            print(traceback.format_exc())
+            logger.exception("❌ %s", error_msg)
             
             # Clean up files
-            if temp_path.exists():
-                temp_path.unlink()
-            if copied_path and copied_path.exists():
+            if target_path.exists():
                 try:
-                    copied_path.unlink()
+                    target_path.unlink()
                 except:
                     pass
             
@@ -268,8 +302,7 @@ def upload_file():
             
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
-        print(f"❌ {error_msg}")
-        print(traceback.format_exc())
+        logger.exception("❌ %s", error_msg)
         
         return jsonify({
             'success': False,
@@ -280,7 +313,7 @@ def upload_file():
 def process_all_files():
     """Process all PDF files in the data directory"""
     try:
-        print("🚀 Starting batch processing of all PDF files...")
+        logger.info("🚀 Starting batch processing of all PDF files...")
         
         # Use the run_all_functionalities function from combined_scraper.py
         result = run_all_functionalities()
@@ -299,8 +332,7 @@ def process_all_files():
             
     except Exception as e:
         error_msg = f"Error during batch processing: {str(e)}"
-        print(f"❌ {error_msg}")
-        print(traceback.format_exc())
+        logger.exception("❌ %s", error_msg)
         
         return jsonify({
             'success': False,
@@ -324,12 +356,17 @@ def list_files():
     """List all processed files"""
     try:
         processed_files = []
-        for file_path in PROCESSED_FOLDER.glob("*.pdf"):
-            processed_files.append({
-                'filename': file_path.name,
-                'size': file_path.stat().st_size,
-                'modified': file_path.stat().st_mtime
-            })
+        # scandir entries cache their stat results, so each file costs a single stat call
+        with os.scandir(PROCESSED_FOLDER) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith('.pdf') or not entry.is_file():
+                    continue
+                file_stat = entry.stat()
+                processed_files.append({
+                    'filename': entry.name,
+                    'size': file_stat.st_size,
+                    'modified': file_stat.st_mtime
+                })
         
         return jsonify({
             'success': True,
@@ -342,18 +379,17 @@ def list_files():
         }), 500
 
 if __name__ == '__main__':
-    print("🚀 Starting HFCL Cable Data Processing Backend...")
-    print(f"📁 Upload folder: {UPLOAD_FOLDER}")
-    print(f"📁 Processed folder: {PROCESSED_FOLDER}")
-    print(f"📁 Output folder: {OUTPUT_FOLDER}")
-    print(f"🔧 Scraper directory: {scraper_dir}")
-    print(f"🖥️  Platform: {platform.system()}")
-    print("=" * 60)
+    logger.info("🚀 Starting HFCL Cable Data Processing Backend...")
+    logger.info("📁 Processed folder: %s", PROCESSED_FOLDER)
+    logger.info("📁 Output folder: %s", OUTPUT_FOLDER)
+    logger.info("🔧 Scraper directory: %s", scraper_dir)
+    logger.info("🖥️  Platform: %s", platform.system())
+    logger.info("=" * 60)
     
     # Windows-compatible configuration
     if platform.system() == 'Windows':
-        print("🪟 Windows detected - using compatible configuration")
+        logger.info("🪟 Windows detected - using compatible configuration")
         app.run(debug=False, host='0.0.0.0', port=5000, use_reloader=False)
     else:
-        print("🐧 Unix/Linux detected - using standard configuration")
+        logger.info("🐧 Unix/Linux detected - using standard configuration")
         app.run(debug=True, host='0.0.0.0', port=5000)
@@ -6,8 +6,11 @@ Run this if you encounter permission errors with existing files
 
 import os
 import shutil
+import logging
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 def cleanup_files():
     """Clean up files that might be causing permission issues"""
     
@@ -15,9 +18,9 @@ def cleanup_files():
     current_dir = Path(__file__).parent
     scraper_dir = current_dir.parent / "scraper"
     
-    print("🧹 Starting file cleanup...")
-    print(f"📁 Current directory: {current_dir}")
-    print(f"📁 Scraper directory: {scraper_dir}")
+    logger.info("🧹 Starting file cleanup...")
+    logger.info("📁 Current directory: %s", current_dir)
+    logger.info("📁 Scraper directory: %s", scraper_dir)
     
     # Clean up backend directories
     backend_dirs = [
@@ -28,75 +31,81 @@ def cleanup_files():
     
     for dir_path in backend_dirs:
         if dir_path.exists():
-            print(f"🗑️  Cleaning {dir_path.name} directory...")
+            logger.info("🗑️  Cleaning %s directory...", dir_path.name)
             try:
                 # Remove all files in the directory
-                for file_path in dir_path.glob("*"):
-                    try:
-                        if file_path.is_file():
-                            file_path.unlink()
-                            print(f"  ✅ Removed: {file_path.name}")
-                        elif file_path.is_dir():
-                            shutil.rmtree(file_path)
-                            print(f"  ✅ Removed directory: {file_path.name}")
-                    except PermissionError:
-                        print(f"  ⚠️  Could not remove: {file_path.name} (permission denied)")
-                    except Exception as e:
-                        print(f"  ❌ Error removing {file_path.name}: {e}")
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file():
+                                os.unlink(entry.path)
+                                logger.info("  ✅ Removed: %s", entry.name)
+                            elif entry.is_dir():
+                                shutil.rmtree(entry.path)
+                                logger.info("  ✅ Removed directory: %s", entry.name)
+                        except PermissionError:
+                            logger.warning("  ⚠️  Could not remove: %s (permission denied)", entry.name)
+                        except Exception as e:
+                            logger.error("  ❌ Error removing %s: %s", entry.name, e)
             except Exception as e:
-                print(f"  ❌ Error cleaning {dir_path.name}: {e}")
+                logger.error("  ❌ Error cleaning %s: %s", dir_path.name, e)
         else:
-            print(f"📁 Creating {dir_path.name} directory...")
+            logger.info("📁 Creating %s directory...", dir_path.name)
             dir_path.mkdir(exist_ok=True)
     
     # Clean up scraper data directory (optional - ask user first)
     scraper_data_dir = scraper_dir / "data"
     if scraper_data_dir.exists():
-        print(f"\n🗑️  Found existing scraper data directory: {scraper_data_dir}")
-        print("⚠️  This directory contains existing PDF files that might cause conflicts.")
+        logger.info("\n🗑️  Found existing scraper data directory: %s", scraper_data_dir)
+        logger.warning("⚠️  This directory contains existing PDF files that might cause conflicts.")
         
         response = input("Do you want to clean this directory? (y/N): ").strip().lower()
         if response in ['y', 'yes']:
             try:
-                for file_path in scraper_data_dir.glob("*.pdf"):
-                    try:
-                        file_path.unlink()
-                        print(f"  ✅ Removed: {file_path.name}")
-                    except PermissionError:
-                        print(f"  ⚠️  Could not remove: {file_path.name} (permission denied)")
-                    except Exception as e:
-                        print(f"  ❌ Error removing {file_path.name}: {e}")
+                with os.scandir(scraper_data_dir) as entries:
+                    for entry in entries:
+                        if not entry.name.lower().endswith('.pdf'):
+                            continue
+                        try:
+                            os.unlink(entry.path)
+                            logger.info("  ✅ Removed: %s", entry.name)
+                        except PermissionError:
+                            logger.warning("  ⚠️  Could not remove: %s (permission denied)", entry.name)
+                        except Exception as e:
+                            logger.error("  ❌ Error removing %s: %s", entry.name, e)
             except Exception as e:
-                print(f"  ❌ Error cleaning scraper data directory: {e}")
+                logger.error("  ❌ Error cleaning scraper data directory: %s", e)
         else:
-            print("  ℹ️  Skipping scraper data directory cleanup")
+            logger.info("  ℹ️  Skipping scraper data directory cleanup")
     
     # Clean up scraper output directory
     scraper_output_dir = scraper_dir / "output"
     if scraper_output_dir.exists():
-        print(f"\n🗑️  Cleaning scraper output directory...")
+        logger.info("\n🗑️  Cleaning scraper output directory...")
         try:
-            for file_path in scraper_output_dir.glob("*.json"):
-                try:
-                    file_path.unlink()
-                    print(f"  ✅ Removed: {file_path.name}")
-                except PermissionError:
-                    print(f"  ⚠️  Could not remove: {file_path.name} (permission denied)")
-                except Exception as e:
-                    print(f"  ❌ Error removing {file_path.name}: {e}")
+            with os.scandir(scraper_output_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    try:
+                        os.unlink(entry.path)
+                        logger.info("  ✅ Removed: %s", entry.name)
+                    except PermissionError:
+                        logger.warning("  ⚠️  Could not remove: %s (permission denied)", entry.name)
+                    except Exception as e:
+                        logger.error("  ❌ Error removing %s: %s", entry.name, e)
         except Exception as e:
-            print(f"  ❌ Error cleaning scraper output directory: {e}")
+            logger.error("  ❌ Error cleaning scraper output directory: %s", e)
     
-    print("\n✅ Cleanup complete!")
-    print("💡 You can now try uploading files again.")
-    print("🚀 Start the backend with: python run_simple.py")
+    logger.info("\n✅ Cleanup complete!")
+    logger.info("💡 You can now try uploading files again.")
+    logger.info("🚀 Start the backend with: python run_simple.py")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO'), format='%(message)s')
     try:
         cleanup_files()
     except Exception as e:
-        print(f"❌ Cleanup failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Cleanup failed: %s", e)
     
     input("\nPress Enter to exit...")
@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration for the HFCL Cable Data Processing Backend
+Runs several worker processes so PDF uploads are parsed concurrently
+"""
+
+import multiprocessing
+import os
+
+# Server socket
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+
+# Worker processes (2 * CPU + 1 unless overridden). Each worker extracts PDFs in its own
+# pool of up to MAX_PDF_WORKERS (4) processes while requests are running, so under full
+# load the server runs up to workers x 4 extraction processes; lower WEB_CONCURRENCY to
+# cap that. The pools are shut down once idle.
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = 4
+
+# PDF parsing and API posting can block a request for a while on large datasheets
+timeout = 120
@@ -44,7 +44,22 @@ def main():
         print("  - GET  /api/health - Health check")
         print("  - GET  /api/files - List processed files")
         print("=" * 60)
-        
+
+        # Use Gunicorn with multiple workers where it is available (not on Windows)
+        if platform.system() != 'Windows':
+            try:
+                import gunicorn  # noqa: F401
+            except ImportError:
+                print("⚠️  Gunicorn not installed - falling back to the Flask development server")
+            else:
+                print("🚀 Starting Gunicorn server...")
+                os.execv(sys.executable, [
+                    sys.executable, '-m', 'gunicorn',
+                    '-c', str(current_dir / 'gunicorn.conf.py'),
+                    '--chdir', str(current_dir),
+                    'wsgi:application'
+                ])
+
         # Start the Flask app with Windows-compatible settings
         print("🚀 Starting Flask server...")
         app.run(debug=False, host='0.0.0.0', port=5000, use_reloader=False)
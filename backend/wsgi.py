@@ -0,0 +1,7 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for running the backend under Gunicorn
+Usage (from the backend directory): gunicorn -c gunicorn.conf.py wsgi:application
+"""
+
+from app import app as application
@@ -5,15 +5,47 @@ This file combines all functionality from the separate modules into one comprehe
 """
 
 import os
-import json
+import io
+import orjson
+import random
+import hashlib
 import pdfplumber
+import ahocorasick
 import time
+import logging
 import threading
+import multiprocessing
+import asyncio
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from watchdog.events import FileSystemEvent, FileSystemMovedEvent, PatternMatchingEventHandler
+from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
+from watchdog.observers.api import BaseObserver
+from urllib3.util.retry import Retry
 import re
+from collections import OrderedDict
+from enum import IntEnum
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator, FrozenSet, Set, Tuple, Union
+
+# aiohttp drives the concurrent posting; without it posts fall back to a thread pool
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+# PyMuPDF extracts plain text in C without pdfplumber's layout pass; it is optional
+try:
+    import pymupdf
+    HAS_PYMUPDF = True
+except ImportError:
+    HAS_PYMUPDF = False
 
 # Suppress SSL warnings for self-signed certificates
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -23,18 +55,29 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 # ============================================================================
 
 # API Configuration
-API_URL = "https://www.hfcl.com/testapiforsap/api/datasheet/configureDatasheet"
-API_KEY = None  # Set your API key here if required
+API_URL: Optional[str] = "https://www.hfcl.com/testapiforsap/api/datasheet/configureDatasheet"
+API_KEY: Optional[str] = None  # Set your API key here if required
+BULK_API_URL: Optional[str] = None  # Endpoint accepting {"cables": [...]} in one request; None posts each cable separately
 
 # File Paths
 JSON_DIRECTORY = "output"  # Directory containing generated JSON files
 DATA_DIRECTORY = "data"     # Directory containing PDF datasheets
 
 # API Request Settings
-DELAY_BETWEEN_REQUESTS = 1.0  # Delay in seconds between API calls
+DELAY_BETWEEN_REQUESTS = 1.0  # Legacy per-call delay, no longer applied (see MAX_REQUESTS_PER_SECOND)
+MAX_REQUESTS_PER_SECOND: Optional[float] = None  # Token-bucket rate limit for API calls; None sends as fast as concurrency allows
 REQUEST_TIMEOUT = 30          # Timeout for API requests in seconds
+MAX_CONCURRENT_REQUESTS = 8   # Maximum number of API requests in flight at once
+BULK_CHUNK_SIZE = 100         # Cables per request when posting to BULK_API_URL
+MAX_RETRIES = 3               # Retries for connection errors and transient HTTP statuses
+RETRY_BACKOFF_FACTOR = 1.0    # Exponential backoff base in seconds (1s, 2s, 4s, ... plus jitter)
 VERIFY_SSL = False            # Set to False for self-signed certificates (like test APIs)
 
+# File monitoring: inotify/FSEvents do not see changes made by other hosts on network
+# filesystems (NFS, SMB), so set WATCH_POLLING=1 there to scan the directory instead
+WATCH_POLLING = os.environ.get("WATCH_POLLING", "").lower() in ("1", "true", "yes")
+POLLING_INTERVAL = 60         # Seconds between directory scans when polling
+
 # Headers (customize as needed)
 DEFAULT_HEADERS = {
     'Content-Type': 'application/json',
@@ -43,147 +86,222 @@ DEFAULT_HEADERS = {
 
 # Logging
 ENABLE_LOGGING = True
-LOG_LEVEL = "INFO"
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")  # Set LOG_LEVEL=WARNING in production to silence progress output
+
+# Status output goes through this logger; handlers come from the host application
+# (the Flask backend) or from basicConfig when run as a script
+logger = logging.getLogger(__name__)
+logger.setLevel(LOG_LEVEL)
+logger.disabled = not ENABLE_LOGGING
+
+# Project paths are resolved on first use, not at import: in the mypyc build __file__
+# is only the bare module filename until the import has finished
+_PROJECT_DIRS: Optional[Tuple[Path, Path]] = None
+
+def _project_dirs() -> Tuple[Path, Path]:
+    """Returns the scraper (data, output) directories, creating the output directory once."""
+    global _PROJECT_DIRS
+    if _PROJECT_DIRS is None:
+        scraper_dir = Path(__file__).resolve().parent
+        output_dir = scraper_dir / "output"
+        output_dir.mkdir(exist_ok=True)
+        _PROJECT_DIRS = (scraper_dir / "data", output_dir)
+    return _PROJECT_DIRS
 
 # ============================================================================
 # SCRAPER FUNCTIONS
 # ============================================================================
 
-def _get_cable_description(text: str) -> str:
-    """Extracts the main cable description from the text."""
+# Regex patterns are compiled once at import instead of on every lookup
+_WS_RE = re.compile(r'\s+')
+
+# Every regex-extracted field is matched by one alternation so the datasheet
+# text is scanned only once. Crush values start with a "<n> N" force, so the
+# crush groups capture it as well - the tensile lookup would have matched there.
+_FIELDS_RE = re.compile(
+    r"(?i:(?P<crush_cm>(?P<crush_cm_force>\d+\s*N)/\d+\s*x?\s*\d*\s*cm)"
+    r"|(?P<crush_mm>(?P<crush_mm_force>\d+\s*N)/\d+\s*x?\s*\d*\s*mm)"
+    r"|(?P<tensile>\d+\s*N)"
+    r"|(?P<diameter>\d+\.\d+\s*±\s*\d+\.\d+\s*mm))"
+    r"|(?P<temp_range>\-?\d+\s*°C\s*to\s*\+\d+\s*°C)"
+    r"|(?P<temp>\-?\d+\s*°C)"
+    r"|(?P<fc>\d+)F"
+)
+
+class Param(IntEnum):
+    """Parameters that _extract_parameter_value can look up"""
+    TENSILE = 1
+    CRUSH = 2
+    DIAMETER = 3
+
+_PARAMETER_FIELDS = {
+    Param.TENSILE: 'tensile',
+    Param.CRUSH: 'crush',
+    Param.DIAMETER: 'diameter'
+}
+
+def _scan_fields(text: str) -> Dict[str, Any]:
+    """
+    Scans whitespace-normalized datasheet text once and returns the first hit
+    for each field, plus every fiber count and temperature mention.
+    """
+    fields: Dict[str, Any] = {}
+    temps: List[str] = []
+    fiber_counts: List[str] = []
+    
+    for match in _FIELDS_RE.finditer(text):
+        kind = match.lastgroup or ''
+        if kind == 'fc':
+            fiber_counts.append(match.group('fc'))
+        elif kind == 'temp':
+            temps.append(match.group('temp'))
+        else:
+            fields.setdefault(kind, match.group(kind))
+            if kind in ('crush_cm', 'crush_mm'):
+                fields.setdefault('tensile', match.group(f'{kind}_force'))
+    
+    # cm values take precedence over mm values, as in the original lookup order
+    crush = fields.get('crush_cm') or fields.get('crush_mm')
+    if crush:
+        fields['crush'] = crush
+    fields['temps'] = tuple(temps)
+    fields['fiber_counts'] = tuple(fiber_counts)
+    return fields
+
+# Detailed descriptions, in priority order, matched case-insensitively
+_DESCRIPTION_PATTERNS = [
+    "Indoor LSZH loose-tube cable",
+    "Outdoor loose-tube cable",
+    "Armoured loose-tube cable",
+    "Micro loose-tube cable",
+    "Unarmoured loose-tube cable"
+]
+# (canonical, lowercased) pairs so matching never re-lowercases a pattern
+_DESCRIPTION_PATTERNS_LOWER = tuple((pattern, pattern.lower()) for pattern in _DESCRIPTION_PATTERNS)
+
+# Case-sensitive keywords used by the cable/tube/fiber classifiers
+_CLASSIFIER_KEYWORDS = [
+    "Unitube", "UTA", "Multitube", "MTUA", "MT UA",
+    "Micro", "MICRO", "G.65", "OM"
+]
+
+def _build_automaton(words: Iterable[str]) -> ahocorasick.Automaton:
+    """Builds an Aho-Corasick automaton whose matches yield the word itself."""
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+_DESCRIPTION_AUTOMATON = _build_automaton(lowered for _, lowered in _DESCRIPTION_PATTERNS_LOWER)
+_KEYWORD_AUTOMATON = _build_automaton(_CLASSIFIER_KEYWORDS)
+
+def _find_keywords(text: str) -> FrozenSet[str]:
+    """
+    Finds every classifier keyword and (lowercased) description pattern in the
+    text with one automaton pass each, instead of one substring scan per check.
+    """
+    hits = {word for _, word in _KEYWORD_AUTOMATON.iter(text)}
+    hits.update(word for _, word in _DESCRIPTION_AUTOMATON.iter(text.lower()))
+    return frozenset(hits)
+
+# The helpers below take the results of one _scan_fields / _find_keywords pass
+# per document, computed in _parse_single_datasheet, rather than the text itself
+
+def _get_cable_description(keywords: FrozenSet[str]) -> str:
+    """Extracts the main cable description from the text's keyword hits."""
     # Look for more detailed descriptions in the PDF
-    detailed_patterns = [
-        r"Indoor LSZH loose-tube cable",
-        r"Outdoor loose-tube cable",
-        r"Armoured loose-tube cable",
-        r"Micro loose-tube cable",
-        r"Unarmoured loose-tube cable"
-    ]
-    
-    for pattern in detailed_patterns:
-        if pattern.lower() in text.lower():
+    for pattern, lowered in _DESCRIPTION_PATTERNS_LOWER:
+        if lowered in keywords:
             return pattern
     
     # Fallback to simple patterns
-    if "MTUA" in text: return "Indoor LSZH loose-tube cable"
-    if "UTA" in text: return "Armoured loose-tube cable"
-    if "MICRO" in text: return "Micro loose-tube cable"
-    if "MT UA" in text: return "Unarmoured loose-tube cable"
+    if "MTUA" in keywords: return "Indoor LSZH loose-tube cable"
+    if "UTA" in keywords: return "Armoured loose-tube cable"
+    if "MICRO" in keywords: return "Micro loose-tube cable"
+    if "MT UA" in keywords: return "Unarmoured loose-tube cable"
     return "Optical Fiber Cable"
 
-def _extract_parameter_value(text: str, parameter_name: str, fiber_count: str = None) -> str:
+def _extract_parameter_value(fields: Dict[str, Any], param: Param) -> str:
     """
-    Extracts a specific parameter value using targeted regex patterns.
+    Extracts a specific parameter value from the single-pass field scan.
+    The scan must be of whitespace-collapsed text (see _parse_single_datasheet).
     """
-    # Clean up the text for better pattern matching
-    text = re.sub(r'\s+', ' ', text)
-    
-    if parameter_name.lower() == 'tensile strength':
-        # Look for tensile strength values.
-        patterns = [
-            r"(\d+\s*N)",
-            r"Installation\s*:\s*(\d+\s*N)",
-            r"Short Term\s*:\s*(\d+\s*N)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-    
-    elif parameter_name.lower() == 'crush resistance':
-        # Look for crush resistance values
-        patterns = [
-            r"(\d+\s*N/\d+\s*x?\s*\d*\s*cm)",
-            r"(\d+\s*N/\d+\s*x?\s*\d*\s*mm)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-    
-    elif parameter_name.lower() == 'cable diameter':
-        # Look for cable diameter values
-        patterns = [
-            r"(\d+\.\d+\s*±\s*\d+\.\d+\s*mm)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-    
-    return "N/A"
+    return fields.get(_PARAMETER_FIELDS[param], "N/A")
 
-def _get_tube_type(text: str) -> str:
+def _get_tube_type(keywords: FrozenSet[str]) -> str:
     """Extracts the specific tube type."""
-    if "Unitube" in text or "UTA" in text: return "Unitube"
-    if "Multitube" in text or "MTUA" in text or "MT UA" in text: return "Multitube"
-    if "Micro" in text: return "Micro"
+    if "Unitube" in keywords or "UTA" in keywords: return "Unitube"
+    if "Multitube" in keywords or "MTUA" in keywords or "MT UA" in keywords: return "Multitube"
+    if "Micro" in keywords: return "Micro"
     return "Standard"
 
 def _get_tube_color_coding(text: str) -> str:
     """Returns N/A for tube color coding as requested."""
     return "N/A"
 
-def _get_detailed_fiber_type(text: str, fiber_count: str = None) -> str:
+def _get_detailed_fiber_type(keywords: FrozenSet[str], fiber_count: Optional[str] = None) -> str:
     """Extracts detailed fiber type information."""
     # Special case for 144F and 288F cables
     if fiber_count in ["144", "288"]:
         return "G.657A1"
     
     # Look for specific fiber type standards
-    if "G.65" in text: return "G.652D"
-    if "OM" in text: return "OM1"
+    if "G.65" in keywords: return "G.652D"
+    if "OM" in keywords: return "OM1"
     return "G.652D"
 
-def _get_nesc_condition(text: str) -> str:
+def _get_nesc_condition(fields: Dict[str, Any]) -> str:
     """Extracts NESC condition information with temperature ranges."""
     # Look for temperature range patterns
-    temp_match = re.search(r"(\-?\d+\s*°C\s*to\s*\+\d+\s*°C)", text)
-    if temp_match:
-        return temp_match.group(1).strip()
+    if 'temp_range' in fields:
+        return fields['temp_range']
     
     # Look for individual temperature mentions
-    temps = re.findall(r"(\-?\d+\s*°C)", text)
+    temps = fields['temps']
     if temps:
         return f"Temperature range: {', '.join(temps)}"
     
     return "N/A"
 
-def _get_cable_type(text: str) -> str:
+def _get_cable_type(keywords: FrozenSet[str]) -> str:
     """Determines if the cable is Unitube (UT) or Multitube (MT)."""
-    if "Unitube" in text or "UTA" in text: return "UT"
-    if "Multitube" in text or "MTUA" in text or "MT UA" in text: return "MT"
+    if "Unitube" in keywords or "UTA" in keywords: return "UT"
+    if "Multitube" in keywords or "MTUA" in keywords or "MT UA" in keywords: return "MT"
     return "N/A"
 
-def _get_fiber_type(text: str) -> str:
+def _get_fiber_type(keywords: FrozenSet[str]) -> str:
     """Determines if the fiber is Single-Mode (SM) or Multi-Mode (MM)."""
-    if "G.65" in text: return "SM"
-    if "OM" in text: return "MM"
+    if "G.65" in keywords: return "SM"
+    if "OM" in keywords: return "MM"
     return "N/A"
 
 def _parse_single_datasheet(filename: str, text: str) -> List[Dict[str, Any]]:
     """Parses text from a single datasheet, returning a list of cable data dicts."""
     results = []
-    cable_description = _get_cable_description(text)
     
-    # Extract fiber counts from text
-    text_fcs = re.findall(r'(\d+)F', text)
+    # One regex scan of the whitespace-collapsed text for the extracted fields, and one
+    # keyword scan of the raw text for the classifiers - a keyword split across lines
+    # ("MT\nUA") is not a hit. Both are passed to the helpers and dropped with the text.
+    fields = _scan_fields(_WS_RE.sub(' ', text))
+    keywords = _find_keywords(text)
+    cable_description = _get_cable_description(keywords)
     
-    # Combine, remove duplicates, and sort
-    fiber_counts = sorted(list(set(text_fcs)), key=int)
+    # Extract fiber counts from text, removing duplicates, in numeric order
+    fiber_counts = sorted(set(fields['fiber_counts']), key=int)
 
     if not fiber_counts: 
         return []
 
-    for fc in fiber_counts:
-        # Extract parameters
-        tensile = _extract_parameter_value(text, 'tensile strength')
-        crush = _extract_parameter_value(text, 'crush resistance')
-        diameter = _extract_parameter_value(text, 'cable diameter')
+    # Extract parameters - these depend only on the text, not on the fiber count
+    tensile = _extract_parameter_value(fields, Param.TENSILE)
+    crush = _extract_parameter_value(fields, Param.CRUSH)
+    diameter = _extract_parameter_value(fields, Param.DIAMETER)
+    cable_type = _get_cable_type(keywords)
+    tube = _get_tube_type(keywords)
+    nesc_condition = _get_nesc_condition(fields)
 
+    for fc in fiber_counts:
         # Create description with "F" suffix
         detailed_desc = f"{fc}F {cable_description}"
 
@@ -191,14 +309,14 @@ def _parse_single_datasheet(filename: str, text: str) -> List[Dict[str, Any]]:
             "cableID": 0, 
             "cableDescription": detailed_desc,
             "fiberCount": f"{fc}F",  # Add "F" suffix to fiber count
-            "typeofCable": _get_cable_type(text),
+            "typeofCable": cable_type,
             "span": "N/A", 
-            "tube": _get_tube_type(text),
+            "tube": tube,
             "tubeColorCoding": "N/A",  # Set to N/A as requested
-            "fiberType": _get_detailed_fiber_type(text, fc), 
+            "fiberType": _get_detailed_fiber_type(keywords, fc), 
             "diameter": diameter, 
             "tensile": tensile,
-            "nescCondition": _get_nesc_condition(text), 
+            "nescCondition": nesc_condition, 
             "crush": crush, 
             "blowingLength": "N/A",
             "datasheetURL": filename, 
@@ -208,6 +326,31 @@ def _parse_single_datasheet(filename: str, text: str) -> List[Dict[str, Any]]:
     
     return results
 
+# Parsed results keyed by (filename, blake2b digest of the text). The cache lives in the
+# process that parses: for uploads that is the web worker itself, and a re-uploaded
+# datasheet comes back under the same name once the previous copy has been moved to
+# processed/, so it skips the parse. Batch runs parse in pool workers that exit when
+# idle, and unchanged PDFs there are skipped earlier by the manifest.
+_PARSE_CACHE_SIZE = 128
+_parse_cache: "OrderedDict[Tuple[str, bytes], Tuple[Dict[str, Any], ...]]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+def _parse_cached(filename: str, text: str) -> List[Dict[str, Any]]:
+    """Returns fresh copies of the parse results for text, parsing only on a cache miss."""
+    key = (filename, hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest())
+    with _parse_cache_lock:
+        cached = _parse_cache.get(key)
+        if cached is not None:
+            _parse_cache.move_to_end(key)
+    if cached is None:
+        cached = tuple(_parse_single_datasheet(filename, text))
+        with _parse_cache_lock:
+            _parse_cache[key] = cached
+            if len(_parse_cache) > _PARSE_CACHE_SIZE:
+                _parse_cache.popitem(last=False)
+    # Callers set cableID and may edit the records, so never hand out the cached dicts
+    return [dict(cable) for cable in cached]
+
 def parse_datasheets(files: Dict[str, str]) -> List[Dict[str, Any]]:
     """
     Main function to parse multiple datasheet files.
@@ -219,37 +362,181 @@ def parse_datasheets(files: Dict[str, str]) -> List[Dict[str, Any]]:
     all_cables = []
     for filename, content in files.items():
         try:
-            parsed_cables = _parse_single_datasheet(filename, content)
+            parsed_cables = _parse_cached(filename, content)
             for cable in parsed_cables:
                 cable['cableID'] = 0  # Set all cable IDs to 0
                 all_cables.append(cable)
         except Exception as e:
-            print(f"--> Could not process file {filename}. Error: {e}")
+            logger.error("--> Could not process file %s. Error: %s", filename, e)
     return all_cables
 
 # ============================================================================
 # API POSTER CLASS
 # ============================================================================
 
+# Fields every cable record must contain before it is posted
+_REQUIRED_CABLE_FIELDS = frozenset({
+    "cableID", "cableDescription", "fiberCount", "typeofCable", 
+    "span", "tube", "tubeColorCoding", "fiberType", "diameter", 
+    "tensile", "nescCondition", "crush", "blowingLength", 
+    "datasheetURL", "isActive"
+})
+
+def _load_cable_json(json_file: Path) -> Optional[Dict[str, Any]]:
+    """Reads one cable JSON file in a single read, returning None if it cannot be loaded."""
+    try:
+        with open(json_file, 'rb') as f:
+            cable_data = orjson.loads(f.read())
+        logger.info("  📄 Loaded: %s", json_file.name)
+        return cable_data
+    except Exception as e:
+        logger.error("  ❌ Failed to load %s: %s", json_file.name, e)
+        return None
+
+class _TokenBucket:
+    """
+    Token-bucket rate limiter. Requests pass straight through while tokens remain and
+    only wait once the burst budget is spent; shared safely by threads and coroutines.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Takes one token and returns how many seconds the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+    
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+    
+    async def acquire_async(self) -> None:
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+# HTTP statuses worth retrying. POSTs are not idempotent (the API takes no idempotency
+# key), so only answers meaning the request was not handled qualify: rate limiting, and
+# a gateway or server that could not take it. A 500 or 504 may follow a successful
+# insert, and replaying it would create a duplicate record.
+_RETRY_STATUSES = frozenset((429, 502, 503))
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retry number attempt + 1, honouring a numeric Retry-After header."""
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    return RETRY_BACKOFF_FACTOR * (2 ** attempt) + random.uniform(0, RETRY_BACKOFF_FACTOR / 2)
+
+# Every transport (sync, async, threaded, bulk) builds its per-cable results through these
+# helpers, so the result shape and the validation rules cannot drift apart
+
+def _result(description: str, status_code: Optional[int] = None,
+            response: Any = None, error: Optional[str] = None) -> Dict[str, Any]:
+    """Builds one per-cable result dictionary; it is a failure when error is given."""
+    result: Dict[str, Any] = {"success": error is None}
+    if status_code is not None:
+        result["status_code"] = status_code
+    if error is None:
+        result["response"] = response
+    else:
+        result["error"] = error
+    result["cable_description"] = description
+    return result
+
+def _validate(cable_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Returns the failure result for a record missing required fields, or None if it can be posted."""
+    # One set difference; difference() keeps the result a frozenset, which the
+    # mypyc build checks at runtime (frozenset - dict_keys gives a plain set)
+    missing_fields = _REQUIRED_CABLE_FIELDS.difference(cable_data)
+    if missing_fields:
+        return _result(cable_data.get("cableDescription", "Unknown"),
+                       error=f"Missing required fields: {sorted(missing_fields)}")
+    return None
+
+def _response_result(description: str, status: int, body: bytes) -> Dict[str, Any]:
+    """Turns a single-cable API response into a result dictionary."""
+    if status == 200:
+        return _result(description, status, response=orjson.loads(body) if body else "Success")
+    return _result(description, status, error=f"API Error: {status} - {body.decode('utf-8', errors='replace')}")
+
+def _log_post_result(completed: int, total_cables: int, cable_data: Dict[str, Any],
+                     result: Dict[str, Any]) -> None:
+    """Logs the progress line and outcome for one posted cable."""
+    logger.info("📤 Posted cable %s/%s: %s", completed, total_cables, cable_data.get('cableDescription', 'Unknown'))
+    
+    # Print result
+    if result["success"]:
+        logger.info("  ✅ Success: %s", result['response'])
+    else:
+        logger.error("  ❌ Failed: %s", result['error'])
+
 class APIPoster:
     """Handles posting cable data to the SQL database through the API."""
     
-    def __init__(self, api_url: str, api_key: str = None, verify_ssl: bool = False):
+    # Fixed attribute set: no per-instance __dict__, and the attributes read per cable
+    # in the posting loop resolve through slot descriptors
+    __slots__ = ('api_url', 'api_key', 'verify_ssl', 'bulk_url', '_bulk_supported',
+                 '_rate_limiter', 'session', '_headers')
+    
+    def __init__(self, api_url: str, api_key: Optional[str] = None, verify_ssl: bool = False,
+                 bulk_url: Optional[str] = None, warm: bool = True,
+                 max_rate: Optional[float] = MAX_REQUESTS_PER_SECOND):
         self.api_url = api_url
         self.api_key = api_key
         self.verify_ssl = verify_ssl
+        self.bulk_url = bulk_url
+        # Cleared the first time the bulk endpoint answers 404/405
+        self._bulk_supported = bulk_url is not None
+        self._rate_limiter = _TokenBucket(max_rate) if max_rate else None
         self.session = requests.Session()
+        self.session.verify = verify_ssl
         
-        # Set headers
-        if api_key:
-            self.session.headers.update({
-                'Authorization': f'Bearer {api_key}',
-                'Content-Type': 'application/json'
-            })
-        else:
-            self.session.headers.update({
-                'Content-Type': 'application/json'
-            })
+        # Keep-alive connection pool shared by all requests. Failed connects and the statuses in
+        # _RETRY_STATUSES are retried with exponential backoff, honouring Retry-After. Errors
+        # after the request was sent (read=0, other=0) are not: the server may have stored it.
+        retry = Retry(
+            total=MAX_RETRIES,
+            read=0,
+            other=0,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            backoff_jitter=RETRY_BACKOFF_FACTOR / 2,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset(['POST']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Set headers - built once and shared by the sync session and the async posting sessions
+        self._headers = {
+            'Content-Type': 'application/json',
+            **({'Authorization': f'Bearer {api_key}'} if api_key else {})
+        }
+        self.session.headers.update(self._headers)
+        
+        # Open the first keep-alive connection (DNS, TCP and TLS) in the background so
+        # the first real POST does not pay for the handshake; pass warm=False to skip
+        if warm and api_url:
+            threading.Thread(target=self._warm_connection, daemon=True).start()
+    
+    def _warm_connection(self) -> None:
+        """Sends a cheap HEAD request to prime the session's connection pool; failures are ignored."""
+        try:
+            self.session.head(self.api_url, timeout=5)
+        except Exception as e:
+            logger.debug("Connection warm-up for %s failed: %s", self.api_url, e)
     
     def post_cable_data(self, cable_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -261,107 +548,246 @@ class APIPoster:
         Returns:
             Dictionary with API response information
         """
+        cable_description = cable_data.get("cableDescription", "Unknown")
+        invalid = _validate(cable_data)
+        if invalid:
+            return invalid
+        
         try:
-            # Ensure all required fields are present
-            required_fields = [
-                "cableID", "cableDescription", "fiberCount", "typeofCable", 
-                "span", "tube", "tubeColorCoding", "fiberType", "diameter", 
-                "tensile", "nescCondition", "crush", "blowingLength", 
-                "datasheetURL", "isActive"
-            ]
-            
-            # Validate that all required fields exist
-            missing_fields = [field for field in required_fields if field not in cable_data]
-            if missing_fields:
-                return {
-                    "success": False,
-                    "error": f"Missing required fields: {missing_fields}",
-                    "cable_description": cable_data.get("cableDescription", "Unknown")
-                }
-            
             # Make the API call
+            if self._rate_limiter:
+                self._rate_limiter.acquire()
             response = self.session.post(
                 self.api_url,
-                json=cable_data,
-                timeout=30,
-                verify=self.verify_ssl
+                data=orjson.dumps(cable_data),
+                timeout=30
             )
-            
-            if response.status_code == 200:
-                return {
-                    "success": True,
-                    "status_code": response.status_code,
-                    "response": response.json() if response.content else "Success",
-                    "cable_description": cable_data.get("cableDescription", "Unknown")
-                }
-            else:
-                return {
-                    "success": False,
-                    "status_code": response.status_code,
-                    "error": f"API Error: {response.status_code} - {response.text}",
-                    "cable_description": cable_data.get("cableDescription", "Unknown")
-                }
+            return _response_result(cable_description, response.status_code, response.content)
                 
         except requests.exceptions.RequestException as e:
-            return {
-                "success": False,
-                "error": f"Request failed: {str(e)}",
-                "cable_description": cable_data.get("cableDescription", "Unknown")
-            }
+            return _result(cable_description, error=f"Request failed: {str(e)}")
         except Exception as e:
-            return {
-                "success": False,
-                "error": f"Unexpected error: {str(e)}",
-                "cable_description": cable_data.get("cableDescription", "Unknown")
-            }
+            return _result(cable_description, error=f"Unexpected error: {str(e)}")
+    
+    async def _post_one(self, session: 'aiohttp.ClientSession', semaphore: asyncio.Semaphore,
+                        cable_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async counterpart of post_cable_data, limited by the shared semaphore.
+        Returns a result dictionary of the same shape.
+        """
+        cable_description = cable_data.get("cableDescription", "Unknown")
+        invalid = _validate(cable_data)
+        if invalid:
+            return invalid
+        
+        try:
+            # Make the API call, retrying like the sync session's Retry policy: only failed
+            # connects and _RETRY_STATUSES, never an error once the request may have been sent.
+            # The body is encoded once and the session already sends the JSON Content-Type
+            payload = orjson.dumps(cable_data)
+            async with semaphore:
+                if self._rate_limiter:
+                    await self._rate_limiter.acquire_async()
+                for attempt in range(MAX_RETRIES + 1):
+                    try:
+                        async with session.post(self.api_url, data=payload) as response:
+                            body = await response.read()
+                            status = response.status
+                            retry_after = response.headers.get('Retry-After')
+                    except aiohttp.ClientConnectorError:
+                        if attempt == MAX_RETRIES:
+                            raise
+                        retry_after = None
+                    else:
+                        if status not in _RETRY_STATUSES or attempt == MAX_RETRIES:
+                            break
+                    await asyncio.sleep(_retry_delay(attempt, retry_after))
+            return _response_result(cable_description, status, body)
+                
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return _result(cable_description, error=f"Request failed: {str(e)}")
+        except Exception as e:
+            return _result(cable_description, error=f"Unexpected error: {str(e)}")
+    
+    async def _post_all(self, cable_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Posts all records concurrently over one pooled connection set, keeping input order."""
+        total_cables = len(cable_data_list)
+        completed = 0
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS * 2, ssl=self.verify_ssl)
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        
+        async def post_and_report(cable_data: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal completed
+            result = await self._post_one(session, semaphore, cable_data)
+            completed += 1
+            _log_post_result(completed, total_cables, cable_data, result)
+            return result
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=self._headers) as session:
+            return await asyncio.gather(*(post_and_report(cable_data) for cable_data in cable_data_list))
+    
+    def _post_threaded(self, cable_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Posts all records on a thread pool over the shared requests session, keeping input order.
+        Used where asyncio.run cannot be: aiohttp missing, or an event loop already running.
+        """
+        total_cables = len(cable_data_list)
+        results = []
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            for completed, (cable_data, result) in enumerate(
+                    zip(cable_data_list, executor.map(self.post_cable_data, cable_data_list)), 1):
+                _log_post_result(completed, total_cables, cable_data, result)
+                results.append(result)
+        return results
+    
+    def _post_concurrently(self, cable_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Posts records one request each, concurrently, with aiohttp when possible and threads otherwise."""
+        if HAS_AIOHTTP:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self._post_all(cable_data_list))
+        return self._post_threaded(cable_data_list)
     
     def post_multiple_cables(self, cable_data_list: List[Dict[str, Any]], delay: float = 1.0) -> List[Dict[str, Any]]:
         """
-        Posts multiple cable data records to the API with optional delay between requests.
+        Posts multiple cable data records to the API concurrently.
         
         Args:
             cable_data_list: List of cable data dictionaries
-            delay: Delay in seconds between API calls (default: 1.0)
+            delay: Kept for backwards compatibility; requests are no longer spaced out,
+                   at most MAX_CONCURRENT_REQUESTS are in flight at once instead
             
         Returns:
-            List of API response dictionaries
+            List of API response dictionaries, in the same order as cable_data_list
         """
-        results = []
         total_cables = len(cable_data_list)
         
-        print(f" Starting to post {total_cables} cable records to API...")
-        print(f" API Endpoint: {self.api_url}")
-        print(f" Delay between requests: {delay} seconds")
-        print("=" * 60)
+        logger.info(" Starting to post %s cable records to API...", total_cables)
+        if self._bulk_supported:
+            logger.info(" Bulk API Endpoint: %s", self.bulk_url)
+            logger.info(" Cables per request: %s", BULK_CHUNK_SIZE)
+        else:
+            logger.info(" API Endpoint: %s", self.api_url)
+            logger.info(" Concurrent requests: %s", MAX_CONCURRENT_REQUESTS)
+        logger.info("=" * 60)
         
-        for i, cable_data in enumerate(cable_data_list, 1):
-            print(f"📤 Posting cable {i}/{total_cables}: {cable_data.get('cableDescription', 'Unknown')}")
-            
-            result = self.post_cable_data(cable_data)
-            results.append(result)
-            
-            # Print result
-            if result["success"]:
-                print(f"  ✅ Success: {result['response']}")
-            else:
-                print(f"  ❌ Failed: {result['error']}")
-            
-            # Add delay between requests (except for the last one)
-            if i < total_cables and delay > 0:
-                time.sleep(delay)
+        if self._bulk_supported:
+            results = self.post_cable_batch(cable_data_list)
+        else:
+            results = self._post_concurrently(cable_data_list)
         
         # Summary
         successful = sum(1 for r in results if r["success"])
         failed = len(results) - successful
         
-        print("=" * 60)
-        print(f"   API Posting Summary:")
-        print(f"  ✅ Successful: {successful}")
-        print(f"  ❌ Failed: {failed}")
-        print(f"  📈 Success Rate: {(successful/total_cables)*100:.1f}%")
+        logger.info("=" * 60)
+        logger.info("   API Posting Summary:")
+        logger.info("  ✅ Successful: %s", successful)
+        logger.info("  ❌ Failed: %s", failed)
+        logger.info("  📈 Success Rate: %.1f%%", (successful/total_cables)*100)
         
         return results
     
+    def post_cable_batch(self, cable_data_list: List[Dict[str, Any]],
+                         chunk_size: int = BULK_CHUNK_SIZE) -> List[Dict[str, Any]]:
+        """
+        Posts cables to the bulk endpoint, chunk_size records per request.
+        Falls back to per-cable posting for the remaining records if the endpoint
+        answers 404/405, and remembers that for later calls.
+        
+        Returns:
+            List of API response dictionaries, in the same order as cable_data_list
+        """
+        results: List[Dict[str, Any]] = []
+        bulk_url = self.bulk_url
+        for start in range(0, len(cable_data_list), chunk_size):
+            if not self._bulk_supported or bulk_url is None:
+                results.extend(self._post_concurrently(cable_data_list[start:]))
+                break
+            
+            chunk = cable_data_list[start:start + chunk_size]
+            chunk_results: Dict[int, Dict[str, Any]] = {}
+            
+            # Validate that all required fields exist; only complete records are sent
+            valid_indexes = []
+            for index, cable_data in enumerate(chunk):
+                invalid = _validate(cable_data)
+                if invalid:
+                    chunk_results[index] = invalid
+                else:
+                    valid_indexes.append(index)
+            
+            if valid_indexes:
+                valid_cables = [chunk[index] for index in valid_indexes]
+                batch_results = self._post_chunk(bulk_url, valid_cables)
+                if batch_results is None:
+                    logger.warning("  ⚠️  Bulk endpoint not available, posting cables individually")
+                    self._bulk_supported = False
+                    batch_results = self._post_concurrently(valid_cables)
+                chunk_results.update(zip(valid_indexes, batch_results))
+            
+            for index in range(len(chunk)):
+                result = chunk_results[index]
+                if result["success"]:
+                    logger.info("  ✅ Success: %s", result['cable_description'])
+                else:
+                    logger.error("  ❌ Failed: %s: %s", result['cable_description'], result['error'])
+                results.append(result)
+        
+        return results
+    
+    def _post_chunk(self, bulk_url: str, chunk: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Posts one chunk of validated cables to the bulk endpoint, which must answer 200 with
+        a JSON array holding one result per cable, in order ({"success": false, "error": ...}
+        marks a rejected cable). Returns one result dictionary per cable, or None if the
+        endpoint does not exist.
+        """
+        descriptions = [cable_data.get("cableDescription", "Unknown") for cable_data in chunk]
+        try:
+            if self._rate_limiter:
+                self._rate_limiter.acquire()
+            response = self.session.post(
+                bulk_url,
+                data=orjson.dumps({"cables": chunk}),
+                timeout=REQUEST_TIMEOUT
+            )
+        except requests.exceptions.RequestException as e:
+            return [_result(description, error=f"Request failed: {str(e)}") for description in descriptions]
+        
+        if response.status_code in (404, 405):
+            return None
+        
+        if response.status_code != 200:
+            return [_result(description, response.status_code,
+                            error=f"API Error: {response.status_code} - {response.text}")
+                    for description in descriptions]
+        
+        try:
+            body = orjson.loads(response.content) if response.content else None
+        except orjson.JSONDecodeError:
+            body = None
+        
+        # Without one result per cable there is no telling which records were stored, so the
+        # chunk is reported as failed - not re-posted, which could duplicate the stored ones
+        if not isinstance(body, list) or len(body) != len(chunk):
+            error = (f"Unrecognised bulk response for {len(chunk)} cables: "
+                     f"{response.content[:200].decode('utf-8', errors='replace')}")
+            logger.error("  ❌ %s", error)
+            return [_result(description, response.status_code, error=error) for description in descriptions]
+        
+        results = []
+        for description, item in zip(descriptions, body):
+            if isinstance(item, dict) and item.get("success") is False:
+                results.append(_result(description, response.status_code,
+                                       error=f"API Error: {item.get('error', item)}"))
+            else:
+                results.append(_result(description, response.status_code, response=item))
+        return results
+    
     def post_from_json_files(self, json_directory: str, delay: float = 1.0) -> List[Dict[str, Any]]:
         """
         Posts cable data from JSON files in a directory.
@@ -375,68 +801,67 @@ class APIPoster:
         """
         json_dir = Path(json_directory)
         if not json_dir.exists():
-            return [{
-                "success": False,
-                "error": f"Directory not found: {json_directory}",
-                "cable_description": "N/A"
-            }]
+            return [_result("N/A", error=f"Directory not found: {json_directory}")]
         
         # Find all JSON files
         json_files = list(json_dir.glob("*.json"))
         if not json_files:
-            return [{
-                "success": False,
-                "error": f"No JSON files found in directory: {json_directory}",
-                "cable_description": "N/A"
-            }]
+            return [_result("N/A", error=f"No JSON files found in directory: {json_directory}")]
         
-        print(f"📁 Found {len(json_files)} JSON files in {json_directory}")
+        logger.info("📁 Found %s JSON files in %s", len(json_files), json_directory)
         
-        all_cables = []
-        
-        # Load all JSON files
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    cable_data = json.load(f)
-                    all_cables.append(cable_data)
-                    print(f"  📄 Loaded: {json_file.name}")
-            except Exception as e:
-                print(f"  ❌ Failed to load {json_file.name}: {e}")
+        # Load all JSON files - reads release the GIL, so a thread pool overlaps the disk waits
+        with ThreadPoolExecutor(max_workers=min(32, len(json_files))) as executor:
+            all_cables = [cable for cable in executor.map(_load_cable_json, json_files) if cable]
         
         if not all_cables:
-            return [{
-                "success": False,
-                "error": "No valid cable data found in JSON files",
-                "cable_description": "N/A"
-            }]
+            return [_result("N/A", error="No valid cable data found in JSON files")]
         
         # Post all cables to API
         return self.post_multiple_cables(all_cables, delay)
 
+# One poster (and so one keep-alive connection pool) shared by every caller in the process
+_API_POSTER: Optional[APIPoster] = None
+_API_POSTER_LOCK = threading.Lock()
+
+def _get_api_poster() -> APIPoster:
+    """Returns the shared APIPoster, creating it on first use."""
+    global _API_POSTER
+    if _API_POSTER is None:
+        with _API_POSTER_LOCK:
+            if _API_POSTER is None:
+                # With API_URL unset the poster is never used to post, only constructed
+                _API_POSTER = APIPoster(API_URL or "", API_KEY, VERIFY_SSL, BULK_API_URL)
+    return _API_POSTER
+
 # ============================================================================
 # VALIDATION FUNCTIONS
 # ============================================================================
 
-def validate_json_output(cable_data: dict) -> bool:
+# Validation rules, built once instead of on every call
+_VALIDATED_FIELDS = frozenset({'fiberCount', 'typeofCable', 'fiberType', 'diameter', 'tensile', 'crush'})
+_FIBER_COUNT_RE = re.compile(r'\d+F?')
+_VALID_CABLE_TYPES = frozenset({'UT', 'MT', 'N/A'})
+_VALID_FIBER_TYPES = frozenset({'SM', 'MM', 'N/A'})
+
+def validate_json_output(cable_data: Dict[str, Any]) -> bool:
     """Validates that the extracted cable data has reasonable values."""
-    required_fields = ['fiberCount', 'typeofCable', 'fiberType', 'diameter', 'tensile', 'crush']
-    
-    for field in required_fields:
-        if field not in cable_data:
-            print(f"  Warning: Missing field '{field}'")
-            return False
+    # One set difference reports every missing field at once; difference() keeps it a frozenset
+    missing_fields = _VALIDATED_FIELDS.difference(cable_data)
+    if missing_fields:
+        logger.warning("  Warning: Missing fields %s", sorted(missing_fields))
+        return False
     
     # Check for reasonable values
-    if cable_data['fiberCount'] and not cable_data['fiberCount'].replace('F', '').isdigit():
-        print(f"  Warning: Invalid fiber count: {cable_data['fiberCount']}")
+    if cable_data['fiberCount'] and not _FIBER_COUNT_RE.fullmatch(cable_data['fiberCount']):
+        logger.warning("  Warning: Invalid fiber count: %s", cable_data['fiberCount'])
         return False
     
-    if cable_data['typeofCable'] not in ['UT', 'MT', 'N/A']:
-        print(f"  Warning: Invalid cable type: {cable_data['typeofCable']}")
+    if cable_data['typeofCable'] not in _VALID_CABLE_TYPES:
+        logger.warning("  Warning: Invalid cable type: %s", cable_data['typeofCable'])
     
-    if cable_data['fiberType'] not in ['SM', 'MM', 'N/A']:
-        print(f"  Warning: Invalid fiber type: {cable_data['fiberType']}")
+    if cable_data['fiberType'] not in _VALID_FIBER_TYPES:
+        logger.warning("  Warning: Invalid fiber type: %s", cable_data['fiberType'])
     
     return True
 
@@ -444,153 +869,498 @@ def validate_json_output(cable_data: dict) -> bool:
 # PDF PROCESSOR CLASS
 # ============================================================================
 
+# Marker appended after every page's text
+_PAGE_BREAK = "\n--- PAGE BREAK ---\n"
+
+# PDFs with more pages than this have their pages extracted across worker processes
+PARALLEL_PAGE_THRESHOLD = 20
+
+# Whole-PDF extraction stops scaling much past four worker processes, and each extra
+# worker costs a full interpreter plus pdfminer's memory
+MAX_PDF_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Workers are started by a fork server (spawn on Windows), never forked from the caller:
+# under gunicorn the caller is a multi-threaded worker, and a forked child would inherit
+# whatever locks (logging, connection pools) other threads happened to hold
+_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+
+# One bounded pool per process, shared by batch runs and large single PDFs, so concurrent
+# requests in this process queue for MAX_PDF_WORKERS processes instead of each starting
+# their own. It is shut down as soon as no caller is using it, so idle web workers hold no
+# extraction processes; under gunicorn the bound across the server is therefore
+# workers x MAX_PDF_WORKERS while requests run, plus one small fork server per web worker
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_PROCESS_POOL_USERS = 0
+_PROCESS_POOL_LOCK = threading.Lock()
+
+@contextmanager
+def _leased_process_pool() -> Iterator[ProcessPoolExecutor]:
+    """Lends out this process's PDF worker pool, starting it if needed; the last caller to finish shuts it down."""
+    global _PROCESS_POOL, _PROCESS_POOL_USERS
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL is None:
+            _PROCESS_POOL = ProcessPoolExecutor(max_workers=MAX_PDF_WORKERS, mp_context=_POOL_CONTEXT)
+        pool = _PROCESS_POOL
+        _PROCESS_POOL_USERS += 1
+    try:
+        yield pool
+    finally:
+        with _PROCESS_POOL_LOCK:
+            _PROCESS_POOL_USERS -= 1
+            idle_pool = _PROCESS_POOL if _PROCESS_POOL_USERS == 0 else None
+            if idle_pool is not None:
+                _PROCESS_POOL = None
+        if idle_pool is not None:
+            idle_pool.shutdown(wait=False)
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drops a pool whose worker died, so the next caller gets a fresh one."""
+    global _PROCESS_POOL
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL is pool:
+            _PROCESS_POOL = None
+    pool.shutdown(wait=False)
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extracts the text of pages[start:stop] from its own handle on the PDF.
+    Kept at module level so it can run in a ProcessPoolExecutor worker.
+    """
+    # pdfplumber numbers pages from 1; pages outside the range never get a Page object built
+    with pdfplumber.open(pdf_path, pages=list(range(start + 1, stop + 1))) as pdf:
+        return [page.extract_text() for page in pdf.pages]
+
+def _extract_pdf_text_pymupdf(pdf_bytes: bytes) -> str:
+    """Extracts the full text of a PDF with PyMuPDF, one page-break marker after each page."""
+    parts: List[str] = []
+    with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+        for page in doc:
+            parts.append(page.get_text("text"))
+            parts.append(_PAGE_BREAK)
+    return "".join(parts)
+
+def _extract_pdf_text(pdf_path: Union[str, Path], pdf_bytes: bytes) -> str:
+    """Extracts the full text of a PDF, one page-break marker after each page."""
+    if HAS_PYMUPDF:
+        try:
+            return _extract_pdf_text_pymupdf(pdf_bytes)
+        except Exception as e:
+            logger.warning("  ⚠️  PyMuPDF could not read %s, falling back to pdfplumber: %s",
+                           os.path.basename(pdf_path), e)
+    
+    parts: List[str] = []
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        page_count = len(pdf.pages)
+        # Small documents, or ones already being handled in a pool worker, stay single-process
+        if page_count <= PARALLEL_PAGE_THRESHOLD or multiprocessing.parent_process() is not None:
+            for page in pdf.pages:
+                parts.append(page.extract_text())
+                parts.append(_PAGE_BREAK)
+            return "".join(parts)
+    
+    # Page layout is pure-Python CPU work, so split the pages into one contiguous range per worker
+    workers = min(MAX_PDF_WORKERS, page_count)
+    pages_per_worker = -(-page_count // workers)
+    with _leased_process_pool() as executor:
+        try:
+            futures = [
+                executor.submit(_extract_page_range, str(pdf_path), start, min(start + pages_per_worker, page_count))
+                for start in range(0, page_count, pages_per_worker)
+            ]
+            for future in futures:
+                for page_text in future.result():
+                    parts.append(page_text)
+                    parts.append(_PAGE_BREAK)
+        except BrokenProcessPool:
+            _discard_process_pool(executor)
+            raise
+    return "".join(parts)
+
+def _process_one(pdf_path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """
+    Extracts and parses a single PDF, returning its cable variants.
+    Kept at module level so it can run in a ProcessPoolExecutor worker.
+    """
+    pdf_name = os.path.basename(pdf_path)
+    
+    # Read the file in one sequential read so pdfminer's many small seeks and
+    # reads are served from memory rather than the disk or network share
+    pdf_bytes = Path(pdf_path).read_bytes()
+    
+    # Extract text from PDF
+    full_text = _extract_pdf_text(pdf_path, pdf_bytes)
+    logger.info("  ✅ Successfully extracted %s characters", len(full_text))
+    
+    # Parse the datasheet
+    file_contents = {pdf_name: full_text}
+    return parse_datasheets(file_contents)
+
+# Raw descriptor flags for output files; O_BINARY only exists (and only matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Writes already-encoded bytes straight to a file descriptor, skipping Python's buffered file layer."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            # Bound to a local first: mypyc evaluates a call inside a slice bound twice
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+def _output_filename(cable: Dict[str, Any]) -> str:
+    """Name of the JSON file a cable variant is saved as: <pdf stem>_<fiber count>.json"""
+    return f"{Path(cable['datasheetURL']).stem}_{cable['fiberCount']}.json"
+
+def _sha256_file(path: Path) -> str:
+    """Hashes a file in 1 MiB reads without holding the whole PDF in memory."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+# Records, per PDF name, the content hash and the outputs it produced, so startup can skip
+# PDFs that have not changed since their JSON was written. Delete it to force a full rerun.
+_MANIFEST_NAME = Path(".cache") / "manifest.json"
+
+# Bump whenever parsing or the output JSON changes, so outputs written by an older
+# parser are regenerated instead of skipped
+_PARSER_VERSION = 1
+
+def _load_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Loads the {pdf name: {"sha256", "outputs", "posted"}} manifest entries. A missing or
+    corrupt manifest, or one written by another parser version, is treated as empty.
+    """
+    try:
+        manifest = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get('parser_version') != _PARSER_VERSION:
+        return {}
+    files = manifest.get('files')
+    return files if isinstance(files, dict) else {}
+
+def _save_manifest(path: Path, files: Dict[str, Dict[str, Any]]) -> None:
+    """Writes the manifest atomically so an interrupted run never leaves it half-written."""
+    path.parent.mkdir(exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    manifest = {'parser_version': _PARSER_VERSION, 'files': files}
+    _write_bytes(tmp_path, orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
+
+def _mark_manifest_posted(path: Path) -> None:
+    """Records every manifest entry as posted after all saved outputs posted successfully."""
+    files = _load_manifest(path)
+    if not files:
+        return
+    for entry in files.values():
+        entry['posted'] = True
+    try:
+        _save_manifest(path, files)
+    except OSError as e:
+        logger.warning("  ⚠️  Could not update %s: %s", path, e)
+
 class PDFProcessor:
     """Handles PDF processing and file monitoring."""
     
-    def __init__(self, data_dir, output_dir):
+    def __init__(self, data_dir: Path, output_dir: Path):
         self.data_dir = data_dir
         self.output_dir = output_dir
-        self.processed_files = set()
+        self.processed_files: Set[str] = set()
         self.lock = threading.Lock()
         
         # Initialize API poster
-        self.api_poster = APIPoster(API_URL, API_KEY, VERIFY_SSL)
+        self.api_poster = _get_api_poster()
     
-    def _process_single_pdf(self, pdf_path):
-        """Process a single PDF file and generate JSON outputs."""
+    def _process_single_pdf(self, pdf_path: Path, post_to_api: bool = True) -> List[Dict[str, Any]]:
+        """
+        Process a single PDF file and generate JSON outputs.
+        Returns the extracted cable records, so callers that post them themselves
+        (with post_to_api=False) need not read the JSON files back.
+        """
         pdf_name = os.path.basename(pdf_path)
         
         try:
-            # Extract text from PDF
-            with pdfplumber.open(pdf_path) as pdf:
-                full_text = "".join(page.extract_text() + "\n--- PAGE BREAK ---\n" for page in pdf.pages)
-                print(f"  ✅ Successfully extracted {len(full_text)} characters")
-            
-            # Parse the datasheet
-            file_contents = {pdf_name: full_text}
-            all_cables_data = parse_datasheets(file_contents)
-            
-            if not all_cables_data:
-                print(f"  ⚠️  No cable data extracted from {pdf_name}")
-                return
+            all_cables_data = _process_one(pdf_path)
             
-            print(f" Extracted {len(all_cables_data)} cable variants")
-            
-            # Validate and save each cable variant
-            valid_count = 0
-            saved_count = 0
-            
-            for cable in all_cables_data:
-                print(f"    Cable {cable['cableID']}: {cable['cableDescription']}")
-                print(f"      Fiber Count: {cable['fiberCount']}")
-                print(f"      Type: {cable['typeofCable']}, Fiber: {cable['fiberType']}")
-                print(f"      Diameter: {cable['diameter']}")
-                print(f"      Tensile: {cable['tensile']}")
-                print(f"      Crush: {cable['crush']}")
-                
-                if validate_json_output(cable):
-                    valid_count += 1
-                
-                # Save individual JSON file
-                original_filename = Path(cable['datasheetURL']).stem
-                fiber_count = cable['fiberCount']
-                
-                output_filename = f"{original_filename}_{fiber_count}.json"
-                output_path = self.output_dir / output_filename
-                
-                try:
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        json.dump(cable, f, indent=2)
-                    print(f"      💾 Saved: {output_filename}")
-                    saved_count += 1
-                except Exception as e:
-                    print(f"      ❌ Failed to save {output_filename}: {e}")
-                
-                print()
-            
-            print(f"    Processing complete for {pdf_name}")
-            print(f"    Valid cables: {valid_count}/{len(all_cables_data)}")
-            print(f"    Saved files: {saved_count}/{len(all_cables_data)}")
+            if not self._save_cables(pdf_name, all_cables_data):
+                return []
             
             # Post to API if enabled
-            if API_URL:
-                print(f"  📡 Posting {len(all_cables_data)} cable records to API...")
+            if API_URL and post_to_api:
+                logger.info("  📡 Posting %s cable records to API...", len(all_cables_data))
                 try:
                     api_results = self.api_poster.post_multiple_cables(all_cables_data, DELAY_BETWEEN_REQUESTS)
                     successful_api = sum(1 for r in api_results if r["success"])
-                    print(f"  API Results: {successful_api}/{len(api_results)} successful")
+                    logger.info("  API Results: %s/%s successful", successful_api, len(api_results))
                 except Exception as e:
-                    print(f"  ❌ API posting failed: {e}")
+                    logger.error("  ❌ API posting failed: %s", e)
+            
+            return all_cables_data
             
         except Exception as e:
-            print(f"  ❌ Failed to process {pdf_name}: {e}")
+            logger.error("  ❌ Failed to process %s: %s", pdf_name, e)
             raise
     
-    def process_existing_files(self):
-        """Process all existing PDF files in the data directory."""
+    def _save_cables(self, pdf_name: str, all_cables_data: List[Dict[str, Any]]) -> bool:
+        """Validate and save the extracted cable variants as JSON files. Returns False if there were none."""
+        if not all_cables_data:
+            logger.warning("  ⚠️  No cable data extracted from %s", pdf_name)
+            return False
+        
+        logger.info(" Extracted %s cable variants", len(all_cables_data))
+        
+        # Validate and serialize each cable variant
+        valid_count = 0
+        saved_count = 0
+        pending_writes: List[Tuple[str, Path, bytes]] = []
+        
+        for cable in all_cables_data:
+            # The per-field dump is only built when debug output is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("    Cable %s: %s", cable['cableID'], cable['cableDescription'])
+                logger.debug("      Fiber Count: %s", cable['fiberCount'])
+                logger.debug("      Type: %s, Fiber: %s", cable['typeofCable'], cable['fiberType'])
+                logger.debug("      Diameter: %s", cable['diameter'])
+                logger.debug("      Tensile: %s", cable['tensile'])
+                logger.debug("      Crush: %s", cable['crush'])
+            
+            if validate_json_output(cable):
+                valid_count += 1
+            
+            # Save individual JSON file
+            output_filename = _output_filename(cable)
+            output_path = self.output_dir / output_filename
+            pending_writes.append((output_filename, output_path, orjson.dumps(cable, option=orjson.OPT_INDENT_2)))
+        
+        # Save the files concurrently - os.write releases the GIL, so the
+        # writes and directory updates overlap instead of queueing
+        with ThreadPoolExecutor(max_workers=min(8, len(pending_writes))) as executor:
+            writes = [(output_filename, executor.submit(_write_bytes, output_path, data))
+                      for output_filename, output_path, data in pending_writes]
+        
+        for output_filename, write in writes:
+            error = write.exception()
+            if error is None:
+                logger.debug("      💾 Saved: %s", output_filename)
+                saved_count += 1
+            else:
+                logger.error("      ❌ Failed to save %s: %s", output_filename, error)
+        
+        logger.info("    Processing complete for %s", pdf_name)
+        logger.info("    Valid cables: %s/%s", valid_count, len(all_cables_data))
+        logger.info("    Saved files: %s/%s", saved_count, len(all_cables_data))
+        
+        return True
+    
+    def process_existing_files(self, post_to_api: bool = True) -> int:
+        """
+        Process all existing PDF files in the data directory.
+        PDFs are extracted in parallel worker processes; saving and a single batch
+        API post of every extracted cable happen here in the parent.
+        PDFs whose content and outputs are unchanged since the last run are skipped; if
+        their cables were never posted successfully, the saved outputs are posted again.
+        Returns the number of PDF files processed.
+        """
         pdf_files = list(self.data_dir.glob("*.pdf"))
         
         if not pdf_files:
-            print("No existing PDF files found in data directory.")
-            return
+            logger.info("No existing PDF files found in data directory.")
+            return 0
         
-        print(f"📁 Found {len(pdf_files)} existing PDF files")
-        print("Processing existing files...")
+        logger.info("📁 Found %s existing PDF files", len(pdf_files))
+        logger.info("Processing existing files...")
         
+        manifest_path = self.output_dir / _MANIFEST_NAME
+        old_manifest = _load_manifest(manifest_path)
+        # Only entries for PDFs still present are kept, so the manifest cannot grow without bound
+        manifest: Dict[str, Dict[str, Any]] = {}
+        pdf_hashes: Dict[Path, Optional[str]] = {}
+        posting = bool(API_URL and post_to_api)
+        # Cables to post this run, and the [start, stop) slice of them each PDF owns
+        all_cables_data: List[Dict[str, Any]] = []
+        pdf_cable_ranges: Dict[str, Tuple[int, int]] = {}
         for pdf_path in pdf_files:
-            pdf_name = pdf_path.name
+            try:
+                pdf_hash: Optional[str] = _sha256_file(pdf_path)
+            except OSError as e:
+                # Left to the worker, which reports the failure; never recorded as unchanged
+                logger.warning("  ⚠️  Could not hash %s: %s", pdf_path.name, e)
+                pdf_hash = None
+            
+            # Entries are keyed by name because the outputs are named after the PDF: a renamed
+            # or duplicated PDF has no entry of its own yet and is processed
+            entry = old_manifest.get(pdf_path.name)
+            if (pdf_hash is not None and isinstance(entry, dict) and entry.get('sha256') == pdf_hash
+                    and entry.get('outputs')
+                    and all((self.output_dir / name).exists() for name in entry['outputs'])):
+                # Outputs saved by a run whose post failed (or was off) are posted again from disk;
+                # one that no longer loads sends the PDF back for processing instead
+                unposted = None
+                if posting and not entry.get('posted'):
+                    unposted = [_load_cable_json(self.output_dir / name) for name in entry['outputs']]
+                if unposted is None or all(unposted):
+                    logger.info("⏭️  Unchanged since last run, skipping: %s", pdf_path.name)
+                    self.processed_files.add(pdf_path.name)
+                    manifest[pdf_path.name] = entry
+                    if unposted:
+                        pdf_cable_ranges[pdf_path.name] = (len(all_cables_data), len(all_cables_data) + len(unposted))
+                        all_cables_data.extend(cable for cable in unposted if cable)
+                    continue
+            pdf_hashes[pdf_path] = pdf_hash
+        
+        if pdf_hashes:
+            with _leased_process_pool() as executor:
+                futures = {executor.submit(_process_one, pdf_path): pdf_path for pdf_path in pdf_hashes}
+                for future in as_completed(futures):
+                    pdf_path = futures[future]
+                    self.processed_files.add(pdf_path.name)
+                    # A corrupt or unreadable PDF only loses its own cables, not the whole batch
+                    try:
+                        cables = future.result()
+                    except Exception as e:
+                        if isinstance(e, BrokenProcessPool):
+                            _discard_process_pool(executor)
+                        logger.error("\n❌ Error processing %s: %s", pdf_path.name, e)
+                        continue
+                    
+                    logger.info("\n📄 Processed existing file: %s", pdf_path.name)
+                    if self._save_cables(pdf_path.name, cables):
+                        pdf_cable_ranges[pdf_path.name] = (len(all_cables_data), len(all_cables_data) + len(cables))
+                        all_cables_data.extend(cables)
+                        pdf_hash = pdf_hashes[pdf_path]
+                        if pdf_hash is not None:
+                            manifest[pdf_path.name] = {
+                                'sha256': pdf_hash,
+                                'outputs': [_output_filename(cable) for cable in cables],
+                                'posted': False
+                            }
+        
+        logger.info("\n✅ All existing files processed!")
+        
+        # Post everything in one batch so the whole run shares one connection pool
+        if posting and all_cables_data:
+            logger.info("  📡 Posting %s cable records to API...", len(all_cables_data))
+            try:
+                api_results = self.api_poster.post_multiple_cables(all_cables_data, DELAY_BETWEEN_REQUESTS)
+                successful_api = sum(1 for r in api_results if r["success"])
+                logger.info("  API Results: %s/%s successful", successful_api, len(api_results))
+                # Results come back in input order; a PDF counts as posted once all its cables are
+                for pdf_name, (start, stop) in pdf_cable_ranges.items():
+                    if pdf_name in manifest:
+                        manifest[pdf_name]['posted'] = all(r["success"] for r in api_results[start:stop])
+            except Exception as e:
+                logger.error("  ❌ API posting failed: %s", e)
+        
+        # Written after the post, so a PDF whose cables did not all post is retried next run
+        try:
+            _save_manifest(manifest_path, manifest)
+        except OSError as e:
+            logger.warning("  ⚠️  Could not update %s: %s", manifest_path, e)
+        
+        return len(pdf_files)
+    
+    def _handle_new_file(self, pdf_path: Path) -> bool:
+        """Process a newly detected PDF once. Returns True if it was processed."""
+        pdf_name = pdf_path.name
+        if not pdf_name.endswith('.pdf'):
+            return False
+        with self.lock:
+            if pdf_name in self.processed_files:
+                return False
             self.processed_files.add(pdf_name)
-            print(f"\n📄 Processing existing file: {pdf_name}")
+        
+        logger.info("\n🆕 New PDF detected: %s", pdf_name)
+        logger.info("Processing...")
+        
+        try:
+            # Wait a bit for file to be fully written
+            time.sleep(1)
+            
+            # Process the new PDF file
             self._process_single_pdf(pdf_path)
+            
+        except Exception as e:
+            logger.error("❌ Error processing %s: %s", pdf_name, e)
         
-        print("\n✅ All existing files processed!")
+        return True
     
-    def check_for_new_files(self):
+    def check_for_new_files(self) -> bool:
         """Check for new PDF files and process them."""
-        current_files = set()
-        for file in os.listdir(self.data_dir):
-            if file.endswith('.pdf'):
-                current_files.add(file)
-        
-        new_files = current_files - self.processed_files
-        
-        for pdf_name in new_files:
-            if pdf_name not in self.processed_files:
-                pdf_path = self.data_dir / pdf_name
-                print(f"\n🆕 New PDF detected: {pdf_name}")
-                print("Processing...")
-                
-                try:
-                    # Wait a bit for file to be fully written
-                    time.sleep(1)
-                    
-                    # Process the new PDF file
-                    self._process_single_pdf(pdf_path)
-                    self.processed_files.add(pdf_name)
-                    
-                except Exception as e:
-                    print(f"❌ Error processing {pdf_name}: {e}")
-        
-        return len(new_files) > 0
+        new_files = [self._handle_new_file(self.data_dir / file) for file in os.listdir(self.data_dir)]
+        return any(new_files)
+    
+    def start_watching(self) -> BaseObserver:
+        """
+        Start processing PDFs as soon as the OS reports them in the data directory,
+        instead of polling with check_for_new_files. Returns the running observer.
+        """
+        handler = PdfHandler(self)
+        observer: BaseObserver = PollingObserver(timeout=POLLING_INTERVAL) if WATCH_POLLING else Observer()
+        try:
+            observer.schedule(handler, str(self.data_dir), recursive=False)
+            observer.start()
+        except OSError as e:
+            # e.g. the inotify watch limit is exhausted - scanning still works
+            logger.warning("⚠️  Native file monitoring unavailable (%s), polling every %ss", e, POLLING_INTERVAL)
+            observer = PollingObserver(timeout=POLLING_INTERVAL)
+            observer.schedule(handler, str(self.data_dir), recursive=False)
+            observer.start()
+        return observer
+
+class PdfHandler(PatternMatchingEventHandler):
+    """Hands PDFs created in, or moved into, the data directory to a PDFProcessor."""
+    
+    def __init__(self, processor: PDFProcessor):
+        # Events for other files and for directories are filtered out before they reach us
+        super().__init__(patterns=["*.pdf"], ignore_directories=True)
+        self.processor = processor
+    
+    def on_created(self, event: FileSystemEvent) -> None:
+        self.processor._handle_new_file(Path(os.fsdecode(event.src_path)))
+    
+    def on_moved(self, event: FileSystemMovedEvent) -> None:
+        # Uploads land as temporary files and are renamed to .pdf once complete
+        self.processor._handle_new_file(Path(os.fsdecode(event.dest_path)))
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def post_existing_json_to_api():
+def _json_outputs_for(output_dir: Path, pdf_filename: str) -> List[Path]:
+    """
+    Lists the <pdf stem>_*.json files generated for one PDF in a single directory scan.
+    A plain prefix match also keeps glob metacharacters in the filename from being interpreted.
+    """
+    prefix = f"{Path(pdf_filename).stem}_"
+    with os.scandir(output_dir) as entries:
+        return [Path(entry.path) for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith('.json')]
+
+def post_existing_json_to_api() -> Dict[str, Any]:
     """
     Posts all existing JSON files in the output directory to the API.
     This function can be called independently to post already processed data.
     """
-    project_root = Path(__file__).parent.parent
-    output_dir = project_root / "scraper/output"
+    _, output_dir = _project_dirs()
     
     if not output_dir.exists():
-        print(f"❌ Output directory not found: {output_dir}")
-        return
+        logger.error("❌ Output directory not found: %s", output_dir)
+        return {
+            "total_processed": 0,
+            "successful": 0,
+            "failed": 0,
+            "results": [],
+            "error": f"Output directory not found: {output_dir}"
+        }
     
-    print("🚀 Posting existing JSON files to API...")
-    poster = APIPoster(API_URL, API_KEY, VERIFY_SSL)
+    logger.info("🚀 Posting existing JSON files to API...")
+    poster = _get_api_poster()
     results = poster.post_from_json_files(str(output_dir), DELAY_BETWEEN_REQUESTS)
     
     # Summary
@@ -598,17 +1368,24 @@ def post_existing_json_to_api():
     total = len(results)
     
     if total > 0:
-        print(f"\n🎯 Final Summary:")
-        print(f"  Total processed: {total}")
-        print(f"  Successful: {successful}")
-        print(f"  Failed: {total - successful}")
+        logger.info("\n🎯 Final Summary:")
+        logger.info("  Total processed: %s", total)
+        logger.info("  Successful: %s", successful)
+        logger.info("  Failed: %s", total - successful)
         
         if successful == total:
-            print("🎉 All existing cable data successfully posted to the database!")
+            logger.info("🎉 All existing cable data successfully posted to the database!")
         else:
-            print("⚠️  Some cable data failed to post. Check the errors above.")
+            logger.warning("⚠️  Some cable data failed to post. Check the errors above.")
+    
+    return {
+        "total_processed": total,
+        "successful": successful,
+        "failed": total - successful,
+        "results": results
+    }
 
-def run_all_functionalities():
+def run_all_functionalities() -> Dict[str, Any]:
     """
     Runs all functionalities in one click:
     1. Process all PDF files in data directory
@@ -618,20 +1395,15 @@ def run_all_functionalities():
     
     This function is perfect for Angular frontend integration.
     """
-    print("🚀 Starting Complete HFCL Cable Data Processing Pipeline")
-    print("=" * 70)
+    logger.info("🚀 Starting Complete HFCL Cable Data Processing Pipeline")
+    logger.info("=" * 70)
     
-    # Get project paths
-    project_root = Path(__file__).parent.parent
-    data_dir = project_root / "scraper/data"
-    output_dir = project_root / "scraper/output"
-    
-    # Create output directory if it doesn't exist
-    output_dir.mkdir(exist_ok=True)
+    # Get project paths (resolved on first use)
+    data_dir, output_dir = _project_dirs()
     
     if not data_dir.is_dir():
         error_msg = f"❌ Error: Input directory not found at '{data_dir}'"
-        print(error_msg)
+        logger.error(error_msg)
         return {
             "success": False,
             "error": error_msg,
@@ -641,32 +1413,35 @@ def run_all_functionalities():
             "results": []
         }
     
-    print(f"📁 Input directory: {data_dir}")
-    print(f"💾 Output directory: {output_dir}")
-    print("=" * 70)
+    logger.info("📁 Input directory: %s", data_dir)
+    logger.info("💾 Output directory: %s", output_dir)
+    logger.info("=" * 70)
     
     # Step 1: Process all PDF files
-    print("\n📋 STEP 1: Processing PDF Files")
-    print("-" * 40)
+    logger.info("\n📋 STEP 1: Processing PDF Files")
+    logger.info("-" * 40)
     
+    # API posting is done separately in step 2, from the saved JSON files
     processor = PDFProcessor(data_dir, output_dir)
-    processor.process_existing_files()
+    pdf_file_count = processor.process_existing_files(post_to_api=False)
     
-    # Count processed files
-    pdf_files = list(data_dir.glob("*.pdf"))
-    print(f"\n✅ PDF Processing Complete: {len(pdf_files)} files processed")
+    logger.info("\n✅ PDF Processing Complete: %s files processed", pdf_file_count)
     
     # Step 2: Post to API
-    print("\n📋 STEP 2: Posting Data to API")
-    print("-" * 40)
+    logger.info("\n📋 STEP 2: Posting Data to API")
+    logger.info("-" * 40)
     
     api_results = None
     if API_URL:
         try:
             api_results = post_existing_json_to_api()
-            print(f"\n✅ API Posting Complete")
+            logger.info("\n✅ API Posting Complete")
+            # Every saved output was just posted; with any failure there is no telling which
+            # PDF it came from, so the entries stay unposted and the next startup retries them
+            if api_results["total_processed"] and not api_results["failed"]:
+                _mark_manifest_posted(output_dir / _MANIFEST_NAME)
         except Exception as e:
-            print(f"❌ API posting failed: {e}")
+            logger.error("❌ API posting failed: %s", e)
             api_results = {
                 "total_processed": 0,
                 "successful": 0,
@@ -675,7 +1450,7 @@ def run_all_functionalities():
                 "error": str(e)
             }
     else:
-        print("⚠️  API URL not configured, skipping API posting")
+        logger.warning("⚠️  API URL not configured, skipping API posting")
         api_results = {
             "total_processed": 0,
             "successful": 0,
@@ -685,35 +1460,35 @@ def run_all_functionalities():
         }
     
     # Step 3: Generate final summary
-    print("\n📋 STEP 3: Final Summary")
-    print("-" * 40)
+    logger.info("\n📋 STEP 3: Final Summary")
+    logger.info("-" * 40)
     
     # Count JSON files generated
     json_files = list(output_dir.glob("*.json"))
     
     final_summary = {
         "success": True,
-        "pdf_files_processed": len(pdf_files),
+        "pdf_files_processed": pdf_file_count,
         "json_files_generated": len(json_files),
         "api_results": api_results,
         "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
         "message": "All functionalities completed successfully"
     }
     
-    print(f"📊 Final Summary:")
-    print(f"  📄 PDF files processed: {final_summary['pdf_files_processed']}")
-    print(f"  💾 JSON files generated: {final_summary['json_files_generated']}")
-    print(f"  📡 API records posted: {api_results['total_processed']}")
-    print(f"  ✅ API successful: {api_results['successful']}")
-    print(f"  ❌ API failed: {api_results['failed']}")
-    print(f"  🕐 Completed at: {final_summary['timestamp']}")
+    logger.info("📊 Final Summary:")
+    logger.info("  📄 PDF files processed: %s", final_summary['pdf_files_processed'])
+    logger.info("  💾 JSON files generated: %s", final_summary['json_files_generated'])
+    logger.info("  📡 API records posted: %s", api_results['total_processed'])
+    logger.info("  ✅ API successful: %s", api_results['successful'])
+    logger.info("  ❌ API failed: %s", api_results['failed'])
+    logger.info("  🕐 Completed at: %s", final_summary['timestamp'])
     
-    print("\n🎉 Complete Pipeline Finished Successfully!")
-    print("=" * 70)
+    logger.info("\n🎉 Complete Pipeline Finished Successfully!")
+    logger.info("=" * 70)
     
     return final_summary
 
-def run_single_pdf_processing(pdf_filename):
+def run_single_pdf_processing(pdf_filename: str) -> Dict[str, Any]:
     """
     Process a single PDF file and post to API immediately.
     Perfect for handling individual file uploads from Angular frontend.
@@ -724,22 +1499,17 @@ def run_single_pdf_processing(pdf_filename):
     Returns:
         Dictionary with processing results
     """
-    print(f"🚀 Processing single PDF: {pdf_filename}")
-    print("=" * 50)
+    logger.info("🚀 Processing single PDF: %s", pdf_filename)
+    logger.info("=" * 50)
     
-    # Get project paths
-    project_root = Path(__file__).parent.parent
-    data_dir = project_root / "scraper/data"
-    output_dir = project_root / "scraper/output"
-    
-    # Create output directory if it doesn't exist
-    output_dir.mkdir(exist_ok=True)
+    # Get project paths (resolved on first use)
+    data_dir, output_dir = _project_dirs()
     
     pdf_path = data_dir / pdf_filename
     
     if not pdf_path.exists():
         error_msg = f"❌ PDF file not found: {pdf_filename}"
-        print(error_msg)
+        logger.error(error_msg)
         return {
             "success": False,
             "error": error_msg,
@@ -750,43 +1520,36 @@ def run_single_pdf_processing(pdf_filename):
     try:
         # Process the PDF
         processor = PDFProcessor(data_dir, output_dir)
-        processor._process_single_pdf(pdf_path)
+        all_cables = processor._process_single_pdf(pdf_path, post_to_api=False)
+        
+        # Get the generated JSON files for this PDF
+        json_files = _json_outputs_for(output_dir, pdf_filename)
         
         # Post to API if enabled
         api_results = None
         if API_URL:
             try:
-                # Get the generated JSON files for this PDF
-                pdf_stem = Path(pdf_filename).stem
-                json_files = list(output_dir.glob(f"{pdf_stem}_*.json"))
-                
-                if json_files:
-                    print(f"\n📡 Posting {len(json_files)} cable records to API...")
-                    poster = APIPoster(API_URL, API_KEY, VERIFY_SSL)
-                    
-                    # Load and post the JSON data
-                    all_cables = []
-                    for json_file in json_files:
-                        with open(json_file, 'r', encoding='utf-8') as f:
-                            cable_data = json.load(f)
-                            all_cables.append(cable_data)
+                if all_cables:
+                    logger.info("\n📡 Posting %s cable records to API...", len(all_cables))
+                    poster = _get_api_poster()
                     
+                    # Post the records straight from memory; the JSON files are only a saved copy
                     api_results = poster.post_multiple_cables(all_cables, DELAY_BETWEEN_REQUESTS)
                     successful_api = sum(1 for r in api_results if r["success"])
                     
-                    print(f"✅ API posting complete: {successful_api}/{len(api_results)} successful")
+                    logger.info("✅ API posting complete: %s/%s successful", successful_api, len(api_results))
                     api_posted = True
                 else:
-                    print("⚠️  No JSON files generated for API posting")
+                    logger.warning("⚠️  No JSON files generated for API posting")
                     api_posted = False
                     api_results = []
                     
             except Exception as e:
-                print(f"❌ API posting failed: {e}")
+                logger.error("❌ API posting failed: %s", e)
                 api_posted = False
                 api_results = [{"success": False, "error": str(e)}]
         else:
-            print("⚠️  API URL not configured, skipping API posting")
+            logger.warning("⚠️  API URL not configured, skipping API posting")
             api_posted = False
             api_results = []
         
@@ -796,21 +1559,21 @@ def run_single_pdf_processing(pdf_filename):
             "pdf_processed": True,
             "api_posted": api_posted,
             "pdf_filename": pdf_filename,
-            "json_files_generated": len(list(output_dir.glob(f"{pdf_stem}_*.json"))),
+            "json_files_generated": len(json_files),
             "api_results": api_results,
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
         }
         
-        print(f"\n✅ Single PDF processing complete!")
-        print(f"  📄 PDF: {pdf_filename}")
-        print(f"  💾 JSON files: {result['json_files_generated']}")
-        print(f"  📡 API posted: {api_posted}")
+        logger.info("\n✅ Single PDF processing complete!")
+        logger.info("  📄 PDF: %s", pdf_filename)
+        logger.info("  💾 JSON files: %s", result['json_files_generated'])
+        logger.info("  📡 API posted: %s", api_posted)
         
         return result
         
     except Exception as e:
         error_msg = f"❌ Failed to process {pdf_filename}: {e}"
-        print(error_msg)
+        logger.error(error_msg)
         return {
             "success": False,
             "error": error_msg,
@@ -819,7 +1582,7 @@ def run_single_pdf_processing(pdf_filename):
             "pdf_filename": pdf_filename
         }
 
-def process_uploaded_pdf(pdf_filename):
+def process_uploaded_pdf(pdf_filename: str) -> Dict[str, Any]:
     """
     Frontend-friendly function for processing uploaded PDF files.
     This function is specifically designed for Angular frontend integration.
@@ -835,22 +1598,17 @@ def process_uploaded_pdf(pdf_filename):
     Returns:
         Dictionary with comprehensive processing results for frontend display
     """
-    print(f"📤 Processing uploaded PDF: {pdf_filename}")
-    print("=" * 60)
+    logger.info("📤 Processing uploaded PDF: %s", pdf_filename)
+    logger.info("=" * 60)
     
-    # Get project paths
-    project_root = Path(__file__).parent.parent
-    data_dir = project_root / "scraper/data"
-    output_dir = project_root / "scraper/output"
-    
-    # Create output directory if it doesn't exist
-    output_dir.mkdir(exist_ok=True)
+    # Get project paths (resolved on first use)
+    data_dir, output_dir = _project_dirs()
     
     pdf_path = data_dir / pdf_filename
     
     if not pdf_path.exists():
         error_msg = f"❌ PDF file not found: {pdf_filename}"
-        print(error_msg)
+        logger.error(error_msg)
         return {
             "success": False,
             "error": error_msg,
@@ -869,16 +1627,12 @@ def process_uploaded_pdf(pdf_filename):
     
     try:
         # Step 1: Process the PDF and extract cable data
-        print("📋 STEP 1: Processing PDF and extracting cable data...")
+        logger.info("📋 STEP 1: Processing PDF and extracting cable data...")
         processor = PDFProcessor(data_dir, output_dir)
-        processor._process_single_pdf(pdf_path)
-        
-        # Count generated JSON files for this PDF
-        pdf_stem = Path(pdf_filename).stem
-        json_files = list(output_dir.glob(f"{pdf_stem}_*.json"))
-        cables_extracted = len(json_files)
+        all_cables = processor._process_single_pdf(pdf_path, post_to_api=False)
+        cables_extracted = len(all_cables)
         
-        print(f"✅ PDF Processing Complete: {cables_extracted} cable variants extracted")
+        logger.info("✅ PDF Processing Complete: %s cable variants extracted", cables_extracted)
         
         # Step 2: Post to API if enabled
         api_results = None
@@ -886,34 +1640,28 @@ def process_uploaded_pdf(pdf_filename):
         api_failure_count = 0
         
         if API_URL and cables_extracted > 0:
-            print("\n📋 STEP 2: Posting cable data to API...")
+            logger.info("\n📋 STEP 2: Posting cable data to API...")
             try:
-                # Load and post the JSON data
-                all_cables = []
-                for json_file in json_files:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        cable_data = json.load(f)
-                        all_cables.append(cable_data)
-                
-                print(f"📡 Posting {len(all_cables)} cable records to API...")
-                poster = APIPoster(API_URL, API_KEY, VERIFY_SSL)
+                # Post the records straight from memory; the JSON files are only a saved copy
+                logger.info("📡 Posting %s cable records to API...", len(all_cables))
+                poster = _get_api_poster()
                 api_results = poster.post_multiple_cables(all_cables, DELAY_BETWEEN_REQUESTS)
                 
                 # Count API results
                 api_success_count = sum(1 for r in api_results if r.get("success", False))
                 api_failure_count = len(api_results) - api_success_count
                 
-                print(f"✅ API Posting Complete: {api_success_count}/{len(api_results)} successful")
+                logger.info("✅ API Posting Complete: %s/%s successful", api_success_count, len(api_results))
                 
             except Exception as e:
-                print(f"❌ API posting failed: {e}")
+                logger.error("❌ API posting failed: %s", e)
                 api_results = [{"success": False, "error": str(e)}]
                 api_failure_count = 1
         else:
             if not API_URL:
-                print("⚠️  API URL not configured, skipping API posting")
+                logger.warning("⚠️  API URL not configured, skipping API posting")
             else:
-                print("⚠️  No cable data extracted, skipping API posting")
+                logger.warning("⚠️  No cable data extracted, skipping API posting")
             api_results = []
         
         # Calculate processing time
@@ -937,30 +1685,30 @@ def process_uploaded_pdf(pdf_filename):
         }
         
         # Print summary for console
-        print("\n" + "=" * 60)
-        print("📊 UPLOAD PROCESSING SUMMARY")
-        print("=" * 60)
-        print(f"📄 PDF File: {pdf_filename}")
-        print(f"🔍 Cables Extracted: {cables_extracted}")
-        print(f"💾 JSON Files Generated: {cables_extracted}")
-        print(f"📡 API Records Posted: {len(api_results)}")
-        print(f"✅ API Successful: {api_success_count}")
-        print(f"❌ API Failed: {api_failure_count}")
-        print(f"⏱️  Processing Time: {processing_time} seconds")
-        print(f"🕐 Completed at: {result['timestamp']}")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("📊 UPLOAD PROCESSING SUMMARY")
+        logger.info("=" * 60)
+        logger.info("📄 PDF File: %s", pdf_filename)
+        logger.info("🔍 Cables Extracted: %s", cables_extracted)
+        logger.info("💾 JSON Files Generated: %s", cables_extracted)
+        logger.info("📡 API Records Posted: %s", len(api_results))
+        logger.info("✅ API Successful: %s", api_success_count)
+        logger.info("❌ API Failed: %s", api_failure_count)
+        logger.info("⏱️  Processing Time: %s seconds", processing_time)
+        logger.info("🕐 Completed at: %s", result['timestamp'])
+        logger.info("=" * 60)
         
         if api_success_count == len(api_results) and len(api_results) > 0:
-            print("🎉 All cable data successfully posted to the database!")
+            logger.info("🎉 All cable data successfully posted to the database!")
         elif len(api_results) > 0:
-            print("⚠️  Some cable data failed to post. Check the errors above.")
+            logger.warning("⚠️  Some cable data failed to post. Check the errors above.")
         
         return result
         
     except Exception as e:
         processing_time = round(time.time() - start_time, 2)
         error_msg = f"❌ Failed to process {pdf_filename}: {e}"
-        print(error_msg)
+        logger.error(error_msg)
         
         return {
             "success": False,
@@ -980,26 +1728,21 @@ def process_uploaded_pdf(pdf_filename):
 # MAIN FUNCTIONS
 # ============================================================================
 
-def main():
+def main() -> None:
     """
     Automated PDF processing with file monitoring.
     Continuously monitors for new PDF files and processes them automatically.
     """
-    project_root = Path(__file__).parent.parent
-    data_dir = project_root / "scraper/data"
-    output_dir = project_root / "scraper/output"
-
-    # Create output directory if it doesn't exist
-    output_dir.mkdir(exist_ok=True)
+    data_dir, output_dir = _project_dirs()
 
     if not data_dir.is_dir():
-        print(f"❌ Error: Input directory not found at '{data_dir}'")
+        logger.error("❌ Error: Input directory not found at '%s'", data_dir)
         return
 
-    print("🚀 Starting Automated PDF Scraping System")
-    print(f"📁 Monitoring directory: {data_dir}")
-    print(f"💾 Output directory: {output_dir}")
-    print("=" * 60)
+    logger.info("🚀 Starting Automated PDF Scraping System")
+    logger.info("📁 Monitoring directory: %s", data_dir)
+    logger.info("💾 Output directory: %s", output_dir)
+    logger.info("=" * 60)
     
     # Initialize processor
     processor = PDFProcessor(data_dir, output_dir)
@@ -1007,32 +1750,36 @@ def main():
     # Process existing files first
     processor.process_existing_files()
     
-    print("\n👀 Starting file monitoring...")
-    print("📋 System is now monitoring for new PDF files")
-    print("💡 Drop new PDF files into the data directory to process them automatically")
-    print("🛑 Press Ctrl+C to stop the system")
-    print("=" * 60)
+    logger.info("\n👀 Starting file monitoring...")
+    logger.info("📋 System is now monitoring for new PDF files")
+    logger.info("💡 Drop new PDF files into the data directory to process them automatically")
+    logger.info("🛑 Press Ctrl+C to stop the system")
+    logger.info("=" * 60)
     
+    observer = processor.start_watching()
+    # PDFs dropped while the initial batch ran raised no event; pick them up now.
+    # Anything already handled, by the batch or by an event since, is skipped.
+    processor.check_for_new_files()
     try:
-        # Continuous monitoring loop
-        while True:
-            # Check for new files every 2 seconds
-            time.sleep(2)
-            processor.check_for_new_files()
+        # New files are handled on the observer thread as filesystem events arrive
+        while observer.is_alive():
+            observer.join(1)
             
     except KeyboardInterrupt:
-        print("\n\n🛑 Shutting down automated system...")
-        print("✅ System stopped successfully")
+        logger.info("\n\n🛑 Shutting down automated system...")
+        observer.stop()
+        observer.join()
+        logger.info("✅ System stopped successfully")
 
-def api_poster_main():
+def api_poster_main() -> None:
     """
     Main function to demonstrate API posting functionality.
     """
-    print("HFCL Cable Data API Poster")
-    print("=" * 50)
+    logger.info("HFCL Cable Data API Poster")
+    logger.info("=" * 50)
     
     # Initialize API poster
-    poster = APIPoster(API_URL, API_KEY, verify_ssl=False)  # Disable SSL verification for test APIs
+    poster = _get_api_poster()
     
     # Post data from JSON files
     results = poster.post_from_json_files(JSON_DIRECTORY, DELAY_BETWEEN_REQUESTS)
@@ -1042,17 +1789,17 @@ def api_poster_main():
     total = len(results)
     
     if total > 0:
-        print(f"\n Final Summary:")
-        print(f"  Total processed: {total}")
-        print(f"  Successful: {successful}")
-        print(f"  Failed: {total - successful}")
+        logger.info("\n Final Summary:")
+        logger.info("  Total processed: %s", total)
+        logger.info("  Successful: %s", successful)
+        logger.info("  Failed: %s", total - successful)
         
         if successful == total:
-            print("🎉 All cable data successfully posted to the database!")
+            logger.info("🎉 All cable data successfully posted to the database!")
         else:
-            print("⚠️  Some cable data failed to post. Check the errors above.")
+            logger.warning("⚠️  Some cable data failed to post. Check the errors above.")
     else:
-        print("❌ No data was processed.")
+        logger.error("❌ No data was processed.")
 
 # ============================================================================
 # ENTRY POINT
@@ -1061,6 +1808,8 @@ def api_poster_main():
 if __name__ == "__main__":
     import sys
     
+    logging.basicConfig(format='%(message)s')
+    
     if len(sys.argv) > 1:
         if sys.argv[1] == "--post-api":
             # Post existing JSON files to API
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Optional native build of combined_scraper.py with mypyc
+The compiled extension is picked up in place of the .py module when present;
+without it the pure-Python module is used unchanged.
+
+Usage (from the scraper directory):
+    pip install mypy
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name='combined_scraper',
+    ext_modules=mypycify(['--ignore-missing-imports', 'combined_scraper.py']),
+)